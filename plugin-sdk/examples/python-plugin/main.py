@@ -5,13 +5,83 @@ This example demonstrates how to create a Python plugin with tools.
 """
 
 from cognia import Plugin, tool, hook
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+import operator
 import re
+import sys
+
+try:
+    import re2  # google-re2: linear-time DFA matching, same API as re
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
+
+_SENTENCE_TERMINATORS = '.!?'
+_SENTENCE_RE = (re2 if RE2_AVAILABLE else re).compile(f'[{re.escape(_SENTENCE_TERMINATORS)}]+')
+_STRIP_CHARS = _SENTENCE_TERMINATORS + ',;:'
+_strip_punctuation = operator.methodcaller('strip', _STRIP_CHARS)
+
+# Mock weather data, built once at import: city -> response template
+_MOCK_WEATHER: Dict[str, Dict[str, Any]] = {
+    sys.intern(city): {
+        "city": city,
+        "temperature": temp,
+        "condition": condition,
+        "humidity": humidity,
+        "unit": "fahrenheit",
+    }
+    for city, (temp, condition, humidity) in {
+        "new york": (72, "Partly Cloudy", 65),
+        "london": (55, "Rainy", 80),
+        "tokyo": (68, "Sunny", 50),
+        "paris": (62, "Cloudy", 70),
+        "sydney": (78, "Clear", 45),
+    }.items()
+}
+
+_UNKNOWN_WEATHER: Dict[str, Any] = {
+    "city": "",
+    "temperature": 65,
+    "condition": "Unknown",
+    "humidity": 60,
+    "unit": "fahrenheit",
+    "note": "Mock data - city not in database",
+}
+
+
+def _count_text(text: str) -> Tuple[int, int, int, int]:
+    """
+    Count words, characters, sentences, and unique words in text.
+    
+    Returns a (word_count, char_count, sentence_count, unique_word_count) tuple.
+    The text is tokenized by whitespace once and every count reuses that split.
+    """
+    # Count words (split by whitespace). Lowercasing the whole text first costs
+    # one allocation instead of one per word; it never changes word boundaries.
+    words = text.lower().split()
+    word_count = len(words)
+    
+    # Count characters (excluding spaces)
+    char_count = len(text) - text.count(" ")
+    
+    # Count sentences (non-blank segments between . ! ? runs)
+    sentence_count = sum(1 for s in _SENTENCE_RE.split(text) if s and not s.isspace())
+    
+    # Find unique words (strip returns the word itself when there is no edge
+    # punctuation, so only punctuated words allocate)
+    unique_words = set(map(_strip_punctuation, words))
+    
+    return word_count, char_count, sentence_count, len(unique_words)
 
 
 class WeatherPlugin(Plugin):
     """Example Python plugin demonstrating tool and hook usage."""
     
+    # No per-instance state beyond the base Plugin's slots
+    __slots__ = ()
+    
     name = "python-plugin-example"
     version = "1.0.0"
     description = "A simple example demonstrating how to create a Python plugin"
@@ -32,42 +102,21 @@ class WeatherPlugin(Plugin):
             "required": ["city"]
         }
     )
-    async def fetch_weather(self, city: str) -> Dict[str, Any]:
+    def fetch_weather(self, city: str) -> Dict[str, Any]:
         """
         Fetch weather for a city.
         
         Note: This is a mock implementation. In a real plugin, you would
-        call an actual weather API like OpenWeatherMap.
+        call an actual weather API like OpenWeatherMap (and make this an
+        async tool). The mock lookup does no I/O, so it is a plain function
+        and the host calls it directly instead of starting an event loop.
         """
-        # Mock weather data
-        mock_data = {
-            "new york": {"temp": 72, "condition": "Partly Cloudy", "humidity": 65},
-            "london": {"temp": 55, "condition": "Rainy", "humidity": 80},
-            "tokyo": {"temp": 68, "condition": "Sunny", "humidity": 50},
-            "paris": {"temp": 62, "condition": "Cloudy", "humidity": 70},
-            "sydney": {"temp": 78, "condition": "Clear", "humidity": 45},
-        }
-        
-        city_lower = city.lower()
-        if city_lower in mock_data:
-            data = mock_data[city_lower]
-            return {
-                "city": city,
-                "temperature": data["temp"],
-                "condition": data["condition"],
-                "humidity": data["humidity"],
-                "unit": "fahrenheit"
-            }
-        else:
-            # Return generic data for unknown cities
-            return {
-                "city": city,
-                "temperature": 65,
-                "condition": "Unknown",
-                "humidity": 60,
-                "unit": "fahrenheit",
-                "note": "Mock data - city not in database"
-            }
+        # Already-lowercase input hits the table directly without allocating
+        data = _MOCK_WEATHER.get(city) or _MOCK_WEATHER.get(city.lower())
+        if data is not None:
+            return {**data, "city": city}
+        # Return generic data for unknown cities
+        return {**_UNKNOWN_WEATHER, "city": city}
     
     @tool(
         name="count_words",
@@ -85,44 +134,32 @@ class WeatherPlugin(Plugin):
     )
     def count_words(self, text: str) -> Dict[str, Any]:
         """Count words, characters, and sentences in text."""
-        # Count words (split by whitespace)
-        words = text.split()
-        word_count = len(words)
-        
-        # Count characters (excluding spaces)
-        char_count = len(text.replace(" ", ""))
-        
-        # Count sentences (split by . ! ?)
-        sentences = re.split(r'[.!?]+', text)
-        sentence_count = len([s for s in sentences if s.strip()])
-        
-        # Find unique words
-        unique_words = set(word.lower().strip('.,!?;:') for word in words)
+        word_count, char_count, sentence_count, unique_word_count = _count_text(text)
         
         return {
             "word_count": word_count,
             "character_count": char_count,
             "sentence_count": sentence_count,
-            "unique_word_count": len(unique_words),
+            "unique_word_count": unique_word_count,
             "average_word_length": char_count / word_count if word_count > 0 else 0
         }
     
     @hook("on_agent_step")
     async def log_agent_step(self, agent_id: str, step: Dict[str, Any]) -> None:
         """Log when an agent executes a step."""
-        self.logger.info(f"Agent {agent_id} executed step: {step.get('action', 'unknown')}")
+        self.logger.log_info("Agent %s executed step: %s", agent_id, step.get('action', 'unknown'))
     
     async def on_load(self) -> None:
         """Called when the plugin is loaded."""
-        self.logger.info("Python Plugin Example loaded!")
+        self.logger.log_info("Python Plugin Example loaded!")
     
     async def on_enable(self) -> None:
         """Called when the plugin is enabled."""
-        self.logger.info("Python Plugin Example enabled!")
+        self.logger.log_info("Python Plugin Example enabled!")
     
     async def on_disable(self) -> None:
         """Called when the plugin is disabled."""
-        self.logger.info("Python Plugin Example disabled!")
+        self.logger.log_info("Python Plugin Example disabled!")
 
 
 # Export the plugin class
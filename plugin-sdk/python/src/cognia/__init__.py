@@ -13,229 +13,222 @@ Features:
 - Full API access to Cognia features
 """
 
-from .plugin import Plugin, create_plugin
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# Core API - imported eagerly since nearly every plugin needs it
+from .plugin import Plugin, PluginMeta, create_plugin
 from .decorators import tool, hook, command, scheduled, HookType, VALID_HOOKS
 
-# Schema helpers
-from .schema import Schema, parameters, string, number, integer, boolean, array, object, optional, nullable
+if TYPE_CHECKING:
+    # Static view of the lazy exports below, for type checkers and IDEs
+    from .schema import (
+        Schema, parameters, string, number, integer, boolean, array, object, optional,
+        nullable,
+    )
+    from .a2ui import (
+        A2UIComponentType, A2UIAction, A2UIDataBinding, A2UIStyle, A2UIComponentDef,
+        A2UIVariable, A2UITemplateDef, A2UIDataChange, A2UIActionEvent,
+        A2UIComponentRenderer, A2UIBuilder, a2ui_component, a2ui_template,
+        invalidate_template, register_component_renderer, get_component_renderer,
+        component as a2ui_component_helper,
+    )
+    from .modes import (
+        OutputFormat, ModeToolConfig, ModePromptTemplate, ModeDef, ModeContext, mode,
+        ModeBuilder, ModeTemplates,
+    )
+    from .ipc import (
+        IPCMode, IPCMessage, IPCConfig, IPCError, TauriIPC, get_ipc,
+    )
+    from .runtime import (
+        RuntimeSessionAPI, RuntimeProjectAPI, RuntimeVectorAPI, RuntimeStorageAPI,
+        RuntimeEventsAPI, RuntimeNetworkAPI, RuntimeFileSystemAPI, RuntimeShellAPI,
+        RuntimePluginContext, create_runtime_context,
+    )
+    from .types import (
+        PluginType, PluginCapability, PluginPermission, PluginManifest, PluginContext,
+        ToolContext, ToolParameter, ToolMetadata, HookMetadata, CommandMetadata,
+        Session, UIMessage, SessionFilter, MessageQueryOptions, SendMessageOptions,
+        SessionStats, ChatMode, MessageAttachment, Project, ProjectFilter,
+        ProjectFileInput, KnowledgeFile, VectorDocument, VectorSearchOptions,
+        VectorSearchResult, VectorFilter, CollectionOptions, CollectionStats,
+        ThemeState, ThemeMode, ColorThemePreset, ThemeColors, CustomTheme, ExportFormat,
+        ExportOptions, ExportResult, CanvasDocument, CreateCanvasDocumentOptions,
+        CanvasSelection, CanvasDocumentVersion, Artifact, CreateArtifactOptions,
+        ArtifactFilter, NotificationOptions, Notification, NotificationAction,
+        AIChatMessage, AIChatOptions, AIChatChunk, AIModel, ExtensionPoint,
+        ExtensionOptions, ExtendedPermission, NetworkRequestOptions, NetworkResponse,
+        DownloadProgress, DownloadResult, FileEntry, FileStat, FileWatchEvent,
+        ShellOptions, ShellResult, DatabaseResult, TableSchema, TableColumn, TableIndex,
+        ContextMenuItem, ContextMenuClickContext, ContextMenuContext, ShortcutOptions,
+        ShortcutRegistration, WindowOptions, UploadOptions, SpawnOptions, ChildProcess,
+        DatabaseTransaction, CustomExporter, ArtifactRenderer, PluginStatus,
+        PluginSource, PluginActivationEvent, HookPriority, HookRegistrationOptions,
+        HookSandboxExecutionResult, ClipboardContent, DebugLogLevel, DebugLogEntry,
+        TraceEntry, PerformanceMetrics, Breakpoint, DebugSession, SlowOperation,
+        MemoryUsage, PerformanceSample, PerformanceBucket, PerformanceReport,
+        SlowOperationEntry, ProfilerConfig, SemanticVersion, UpdateInfo,
+        VersionHistoryEntry, RollbackOptions, UpdateOptions, DependencySpec,
+        ResolvedDependency, DependencyNode, DependencyConflict, DependencyCheckResult,
+        MessagePriority, SubscriptionOptions, MessageMetadata, MessageEnvelope,
+        TopicStats,
+    )
+    from .debug import (
+        DebugAPI,
+    )
+    from .profiler import (
+        ProfilerAPI,
+    )
+    from .version import (
+        VersionAPI,
+    )
+    from .dependencies import (
+        DependenciesAPI,
+    )
+    from .message_bus import (
+        MessageBusAPI,
+    )
+    from .clipboard import (
+        ClipboardAPI,
+    )
+    from .testing import (
+        MockLogger, MockStorage, MockEventEmitter, MockSettings, MockContextOptions,
+        MockPluginContext, Spy, create_mock_logger, create_mock_storage,
+        create_mock_event_emitter, create_mock_settings, create_mock_context,
+        create_mock_tool_context, create_spy, test_tool, test_hook,
+    )
+    from .context import (
+        ExtendedPluginContext, SessionAPI, ProjectAPI, VectorAPI, ThemeAPI, ExportAPI,
+        CanvasAPI, ArtifactAPI, NotificationCenterAPI, AIProviderAPI, PermissionAPI,
+        NetworkAPI, FileSystemAPI, ShellAPI, DatabaseAPI, ShortcutsAPI, ContextMenuAPI,
+        StorageAPI, EventsAPI, UIAPI, SecretsAPI, I18nAPI, ProgressNotification,
+        DialogOptions, InputDialogOptions, ConfirmDialogOptions, StatusBarItem,
+    )
 
-# A2UI components
-from .a2ui import (
-    A2UIComponentType,
-    A2UIAction,
-    A2UIDataBinding,
-    A2UIStyle,
-    A2UIComponentDef,
-    A2UIVariable,
-    A2UITemplateDef,
-    A2UIDataChange,
-    A2UIActionEvent,
-    A2UIComponentRenderer,
-    A2UIBuilder,
-    a2ui_component,
-    a2ui_template,
-    component as a2ui_component_helper,
-    register_component_renderer,
-    get_component_renderer,
-)
+# Everything else is resolved on first attribute access (PEP 562) so that
+# `from cognia import Plugin, tool` does not pay for loading every submodule.
+_LAZY_SUBMODULES: Dict[str, Tuple[str, ...]] = {
+    # Schema helpers
+    "schema": (
+        "Schema", "parameters", "string", "number", "integer", "boolean", "array", "object",
+        "optional", "nullable",
+    ),
+    # A2UI components
+    "a2ui": (
+        "A2UIComponentType", "A2UIAction", "A2UIDataBinding", "A2UIStyle", "A2UIComponentDef",
+        "A2UIVariable", "A2UITemplateDef", "A2UIDataChange", "A2UIActionEvent",
+        "A2UIComponentRenderer", "A2UIBuilder", "a2ui_component", "a2ui_template",
+        "invalidate_template",
+        "register_component_renderer", "get_component_renderer",
+    ),
+    # Mode definitions
+    "modes": (
+        "OutputFormat", "ModeToolConfig", "ModePromptTemplate", "ModeDef", "ModeContext",
+        "mode", "ModeBuilder", "ModeTemplates",
+    ),
+    # IPC communication
+    "ipc": (
+        "IPCMode", "IPCMessage", "IPCConfig", "IPCError", "TauriIPC", "get_ipc",
+    ),
+    # Runtime context
+    "runtime": (
+        "RuntimeSessionAPI", "RuntimeProjectAPI", "RuntimeVectorAPI", "RuntimeStorageAPI",
+        "RuntimeEventsAPI", "RuntimeNetworkAPI", "RuntimeFileSystemAPI", "RuntimeShellAPI",
+        "RuntimePluginContext", "create_runtime_context",
+    ),
+    # Core types
+    "types": (
+        "PluginType", "PluginCapability", "PluginPermission", "PluginManifest", "PluginContext",
+        "ToolContext", "ToolParameter", "ToolMetadata", "HookMetadata", "CommandMetadata",
+        "Session", "UIMessage", "SessionFilter", "MessageQueryOptions", "SendMessageOptions",
+        "SessionStats", "ChatMode", "MessageAttachment", "Project", "ProjectFilter",
+        "ProjectFileInput", "KnowledgeFile", "VectorDocument", "VectorSearchOptions",
+        "VectorSearchResult", "VectorFilter", "CollectionOptions", "CollectionStats",
+        "ThemeState", "ThemeMode", "ColorThemePreset", "ThemeColors", "CustomTheme",
+        "ExportFormat", "ExportOptions", "ExportResult", "CanvasDocument",
+        "CreateCanvasDocumentOptions", "CanvasSelection", "CanvasDocumentVersion", "Artifact",
+        "CreateArtifactOptions", "ArtifactFilter", "NotificationOptions", "Notification",
+        "NotificationAction", "AIChatMessage", "AIChatOptions", "AIChatChunk", "AIModel",
+        "ExtensionPoint", "ExtensionOptions", "ExtendedPermission", "NetworkRequestOptions",
+        "NetworkResponse", "DownloadProgress", "DownloadResult", "FileEntry", "FileStat",
+        "FileWatchEvent", "ShellOptions", "ShellResult", "DatabaseResult", "TableSchema",
+        "TableColumn", "TableIndex", "ContextMenuItem", "ContextMenuClickContext",
+        "ContextMenuContext", "ShortcutOptions", "ShortcutRegistration", "WindowOptions",
+        "UploadOptions", "SpawnOptions", "ChildProcess", "DatabaseTransaction",
+        "CustomExporter", "ArtifactRenderer", "PluginStatus", "PluginSource",
+        "PluginActivationEvent", "HookPriority", "HookRegistrationOptions",
+        "HookSandboxExecutionResult", "ClipboardContent", "DebugLogLevel", "DebugLogEntry",
+        "TraceEntry", "PerformanceMetrics", "Breakpoint", "DebugSession", "SlowOperation",
+        "MemoryUsage", "PerformanceSample", "PerformanceBucket", "PerformanceReport",
+        "SlowOperationEntry", "ProfilerConfig", "SemanticVersion", "UpdateInfo",
+        "VersionHistoryEntry", "RollbackOptions", "UpdateOptions", "DependencySpec",
+        "ResolvedDependency", "DependencyNode", "DependencyConflict", "DependencyCheckResult",
+        "MessagePriority", "SubscriptionOptions", "MessageMetadata", "MessageEnvelope",
+        "TopicStats",
+    ),
+    # Debug API
+    "debug": ("DebugAPI",),
+    # Profiler API
+    "profiler": ("ProfilerAPI",),
+    # Version API
+    "version": ("VersionAPI",),
+    # Dependencies API
+    "dependencies": ("DependenciesAPI",),
+    # Message bus API
+    "message_bus": ("MessageBusAPI",),
+    # Clipboard API
+    "clipboard": ("ClipboardAPI",),
+    # Testing utilities
+    "testing": (
+        "MockLogger", "MockStorage", "MockEventEmitter", "MockSettings", "MockContextOptions",
+        "MockPluginContext", "Spy", "create_mock_logger", "create_mock_storage",
+        "create_mock_event_emitter", "create_mock_settings", "create_mock_context",
+        "create_mock_tool_context", "create_spy", "test_tool", "test_hook",
+    ),
+    # Context APIs
+    "context": (
+        "ExtendedPluginContext", "SessionAPI", "ProjectAPI", "VectorAPI", "ThemeAPI",
+        "ExportAPI", "CanvasAPI", "ArtifactAPI", "NotificationCenterAPI", "AIProviderAPI",
+        "PermissionAPI", "NetworkAPI", "FileSystemAPI", "ShellAPI", "DatabaseAPI",
+        "ShortcutsAPI", "ContextMenuAPI", "StorageAPI", "EventsAPI", "UIAPI", "SecretsAPI",
+        "I18nAPI", "ProgressNotification", "DialogOptions", "InputDialogOptions",
+        "ConfirmDialogOptions", "StatusBarItem",
+    ),
+}
 
-# Mode definitions
-from .modes import (
-    OutputFormat,
-    ModeToolConfig,
-    ModePromptTemplate,
-    ModeDef,
-    ModeContext,
-    mode,
-    ModeBuilder,
-    ModeTemplates,
-)
+# Public names that differ from the attribute name in their submodule
+_LAZY_ALIASES: Dict[str, Tuple[str, str]] = {
+    "a2ui_component_helper": ("a2ui", "component"),
+}
 
-# IPC communication
-from .ipc import (
-    IPCMode,
-    IPCMessage,
-    IPCConfig,
-    IPCError,
-    TauriIPC,
-    get_ipc,
-)
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    attr: (module, attr)
+    for module, attrs in _LAZY_SUBMODULES.items()
+    for attr in attrs
+}
+_LAZY_IMPORTS.update(_LAZY_ALIASES)
 
-# Runtime context
-from .runtime import (
-    RuntimeSessionAPI,
-    RuntimeProjectAPI,
-    RuntimeVectorAPI,
-    RuntimeStorageAPI,
-    RuntimeEventsAPI,
-    RuntimeNetworkAPI,
-    RuntimeFileSystemAPI,
-    RuntimeShellAPI,
-    RuntimePluginContext,
-    create_runtime_context,
-)
 
-# Core types
-from .types import (
-    PluginType,
-    PluginCapability,
-    PluginPermission,
-    PluginManifest,
-    PluginContext,
-    ToolContext,
-    ToolParameter,
-    ToolMetadata,
-    HookMetadata,
-    CommandMetadata,
-    # Session
-    Session, UIMessage, SessionFilter, MessageQueryOptions, SendMessageOptions, SessionStats, ChatMode,
-    MessageAttachment,
-    # Project
-    Project, ProjectFilter, ProjectFileInput, KnowledgeFile,
-    # Vector/RAG
-    VectorDocument, VectorSearchOptions, VectorSearchResult, VectorFilter, CollectionOptions, CollectionStats,
-    # Theme
-    ThemeState, ThemeMode, ColorThemePreset, ThemeColors, CustomTheme,
-    # Export
-    ExportFormat, ExportOptions, ExportResult,
-    # Canvas
-    CanvasDocument, CreateCanvasDocumentOptions, CanvasSelection, CanvasDocumentVersion,
-    # Artifact
-    Artifact, CreateArtifactOptions, ArtifactFilter,
-    # Notifications
-    NotificationOptions, Notification, NotificationAction,
-    # AI
-    AIChatMessage, AIChatOptions, AIChatChunk, AIModel,
-    # Extensions
-    ExtensionPoint, ExtensionOptions,
-    # Permissions
-    ExtendedPermission,
-    # Network
-    NetworkRequestOptions, NetworkResponse, DownloadProgress, DownloadResult,
-    # File System
-    FileEntry, FileStat, FileWatchEvent,
-    # Shell
-    ShellOptions, ShellResult,
-    # Database
-    DatabaseResult, TableSchema, TableColumn, TableIndex,
-    # Context Menu
-    ContextMenuItem, ContextMenuClickContext, ContextMenuContext,
-    # Shortcuts
-    ShortcutOptions, ShortcutRegistration,
-    # Window
-    WindowOptions,
-    # New types added for SDK parity
-    UploadOptions,
-    SpawnOptions,
-    ChildProcess,
-    DatabaseTransaction,
-    CustomExporter,
-    ArtifactRenderer,
-    PluginStatus,
-    PluginSource,
-    PluginActivationEvent,
-    HookPriority,
-    HookRegistrationOptions,
-    HookSandboxExecutionResult,
-    ClipboardContent,
-    # Debug types
-    DebugLogLevel,
-    DebugLogEntry,
-    TraceEntry,
-    PerformanceMetrics,
-    Breakpoint,
-    DebugSession,
-    SlowOperation,
-    # Profiler types
-    MemoryUsage,
-    PerformanceSample,
-    PerformanceBucket,
-    PerformanceReport,
-    SlowOperationEntry,
-    ProfilerConfig,
-    # Version types
-    SemanticVersion,
-    UpdateInfo,
-    VersionHistoryEntry,
-    RollbackOptions,
-    UpdateOptions,
-    # Dependencies types
-    DependencySpec,
-    ResolvedDependency,
-    DependencyNode,
-    DependencyConflict,
-    DependencyCheckResult,
-    # Message Bus types
-    MessagePriority,
-    SubscriptionOptions,
-    MessageMetadata,
-    MessageEnvelope,
-    TopicStats,
-)
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names from their submodule on first access"""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
 
-# New API modules
-from .debug import DebugAPI
-from .profiler import ProfilerAPI
-from .version import VersionAPI
-from .dependencies import DependenciesAPI
-from .message_bus import MessageBusAPI
-from .clipboard import ClipboardAPI
 
-# Testing utilities
-from .testing import (
-    MockLogger,
-    MockStorage,
-    MockEventEmitter,
-    MockSettings,
-    MockContextOptions,
-    MockPluginContext,
-    Spy,
-    create_mock_logger,
-    create_mock_storage,
-    create_mock_event_emitter,
-    create_mock_settings,
-    create_mock_context,
-    create_mock_tool_context,
-    create_spy,
-    test_tool,
-    test_hook,
-)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Context APIs
-from .context import (
-    ExtendedPluginContext,
-    SessionAPI,
-    ProjectAPI,
-    VectorAPI,
-    ThemeAPI,
-    ExportAPI,
-    CanvasAPI,
-    ArtifactAPI,
-    NotificationCenterAPI,
-    AIProviderAPI,
-    PermissionAPI,
-    NetworkAPI,
-    FileSystemAPI,
-    ShellAPI,
-    DatabaseAPI,
-    ShortcutsAPI,
-    ContextMenuAPI,
-    StorageAPI,
-    EventsAPI,
-    UIAPI,
-    SecretsAPI,
-    I18nAPI,
-    ProgressNotification,
-    DialogOptions,
-    InputDialogOptions,
-    ConfirmDialogOptions,
-    StatusBarItem,
-)
 
 __version__ = "1.0.0"
-__all__ = [
+__all__ = (
     # Plugin base
     "Plugin",
+    "PluginMeta",
     "create_plugin",
     
     # Decorators
@@ -272,6 +265,7 @@ __all__ = [
     "A2UIBuilder",
     "a2ui_component",
     "a2ui_template",
+    "invalidate_template",
     "a2ui_component_helper",
     "register_component_renderer",
     "get_component_renderer",
@@ -527,4 +521,4 @@ __all__ = [
     "InputDialogOptions",
     "ConfirmDialogOptions",
     "StatusBarItem",
-]
+)
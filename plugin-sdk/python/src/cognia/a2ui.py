@@ -6,14 +6,32 @@ in the Cognia UI based on AI-generated data.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 from enum import Enum
 import functools
+import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class A2UIComponentType(Enum):
-    """Standard A2UI component types"""
+
+def _dumps_bytes(data: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+class A2UIComponentType(str, Enum):
+    """Standard A2UI component types (members are their wire strings)"""
+    
+    __str__ = str.__str__
+    __format__ = str.__format__
+    
     # Data Display
     TABLE = "table"
     LIST = "list"
@@ -65,7 +83,7 @@ class A2UIComponentType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class A2UIAction:
     """Action that can be triggered from A2UI component"""
     id: str
@@ -74,9 +92,20 @@ class A2UIAction:
     variant: str = "default"  # 'default', 'primary', 'destructive'
     disabled: bool = False
     confirm: Optional[str] = None  # Confirmation message
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "id": self.id,
+            "label": self.label,
+            "icon": self.icon,
+            "variant": self.variant,
+            "disabled": self.disabled,
+            "confirm": self.confirm,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class A2UIDataBinding:
     """Data binding configuration for A2UI component"""
     source: str  # Data path
@@ -84,7 +113,7 @@ class A2UIDataBinding:
     default: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class A2UIStyle:
     """Style configuration for A2UI component"""
     width: Optional[str] = None
@@ -97,9 +126,37 @@ class A2UIStyle:
     shadow: Optional[str] = None
     class_name: Optional[str] = None
     custom: Dict[str, str] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        result = {}
+        if self.width is not None:
+            result["width"] = self.width
+        if self.height is not None:
+            result["height"] = self.height
+        if self.padding is not None:
+            result["padding"] = self.padding
+        if self.margin is not None:
+            result["margin"] = self.margin
+        if self.background is not None:
+            result["background"] = self.background
+        if self.border is not None:
+            result["border"] = self.border
+        if self.border_radius is not None:
+            result["borderRadius"] = self.border_radius
+        if self.shadow is not None:
+            result["shadow"] = self.shadow
+        if self.class_name is not None:
+            result["className"] = self.class_name
+        if self.custom:
+            # None means "unset"; custom is filled in place, so check on every call
+            for key, value in self.custom.items():
+                if value is not None:
+                    result[key] = value
+        return result
 
 
-@dataclass
+@dataclass(slots=True)
 class A2UIComponentDef:
     """A2UI component definition"""
     type: str
@@ -115,6 +172,26 @@ class A2UIComponentDef:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
+        root = self._to_dict_shallow()
+        if not self.children:
+            return root
+        # Walk the tree with an explicit stack so deep nesting can't hit the
+        # recursion limit; child dicts are linked in before being filled, and
+        # only children that have children of their own are pushed
+        stack = [(self, root)]
+        while stack:
+            node, result = stack.pop()
+            child_dicts = []
+            for child in node.children:
+                child_dict = child._to_dict_shallow()
+                child_dicts.append(child_dict)
+                if child.children:
+                    stack.append((child, child_dict))
+            result["children"] = child_dicts
+        return root
+    
+    def _to_dict_shallow(self) -> Dict[str, Any]:
+        """Serialize every field except children"""
         result = {
             "type": self.type,
             "name": self.name,
@@ -130,38 +207,17 @@ class A2UIComponentDef:
         if self.default_props:
             result["defaultProps"] = self.default_props
         if self.actions:
-            result["actions"] = [
-                {
-                    "id": a.id,
-                    "label": a.label,
-                    "icon": a.icon,
-                    "variant": a.variant,
-                    "disabled": a.disabled,
-                    "confirm": a.confirm,
-                }
-                for a in self.actions
-            ]
+            result["actions"] = [a.to_dict() for a in self.actions]
         if self.style:
-            result["style"] = {
-                k: v for k, v in {
-                    "width": self.style.width,
-                    "height": self.style.height,
-                    "padding": self.style.padding,
-                    "margin": self.style.margin,
-                    "background": self.style.background,
-                    "border": self.style.border,
-                    "borderRadius": self.style.border_radius,
-                    "shadow": self.style.shadow,
-                    "className": self.style.class_name,
-                    **self.style.custom,
-                }.items() if v is not None
-            }
-        if self.children:
-            result["children"] = [c.to_dict() for c in self.children]
+            result["style"] = self.style.to_dict()
         return result
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (uses orjson when installed)"""
+        return _dumps_bytes(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class A2UIVariable:
     """Variable definition for A2UI template"""
     name: str
@@ -171,7 +227,7 @@ class A2UIVariable:
     required: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class A2UITemplateDef:
     """A2UI template definition"""
     id: str
@@ -209,9 +265,13 @@ class A2UITemplateDef:
         if self.tags:
             result["tags"] = self.tags
         return result
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (uses orjson when installed)"""
+        return _dumps_bytes(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class A2UIDataChange:
     """Data change event from A2UI component"""
     component_id: str
@@ -221,7 +281,7 @@ class A2UIDataChange:
     source: str  # 'user', 'system', 'binding'
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class A2UIActionEvent:
     """Action event from A2UI component"""
     component_id: str
@@ -279,6 +339,34 @@ def get_component_renderer(component_type: str) -> Optional[A2UIComponentRendere
     return _component_renderers.get(component_type)
 
 
+def _freeze(value: Any) -> Any:
+    """
+    Convert nested dicts/lists/sets into a hashable cache-key form.
+    
+    Every value is tagged with its type so that 1, 1.0 and True, which
+    compare equal, still produce different keys.
+    """
+    if isinstance(value, dict):
+        return (type(value), frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def invalidate_template(provider: Callable) -> None:
+    """
+    Drop all memoized results of a template provider.
+    
+    Args:
+        provider: The decorated provider function or bound method
+    """
+    cache_clear = getattr(provider, "cache_clear", None)
+    if cache_clear is not None:
+        cache_clear()
+
+
 def a2ui_component(
     component_type: str,
     name: str,
@@ -325,13 +413,7 @@ def a2ui_component(
             icon=icon,
             props_schema=props_schema,
         )
-        
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        wrapper._a2ui_component = func._a2ui_component
-        return wrapper
+        return func
     
     return decorator
 
@@ -345,6 +427,7 @@ def a2ui_template(
     icon: Optional[str] = None,
     tags: Optional[List[str]] = None,
     variables: Optional[List[A2UIVariable]] = None,
+    cache_size: int = 0,
 ) -> Callable:
     """
     Decorator to mark a method as an A2UI template provider.
@@ -360,6 +443,12 @@ def a2ui_template(
         icon: Icon name (Lucide icon)
         tags: Tags for filtering
         variables: Template variable definitions
+        cache_size: Memoize up to this many results, keyed on the call
+            arguments excluding self (0 disables caching). Only enable for
+            providers whose output depends solely on their arguments; cached
+            results are shared between calls and instances and must be
+            treated as read-only. Use invalidate_template() to drop cached
+            results.
         
     Example:
         @a2ui_template(
@@ -389,11 +478,37 @@ def a2ui_template(
             "variables": variables or [],
         }
         
+        if cache_size <= 0:
+            return func
+        
+        # Each provider owns its cache; self is left out of the key so cached
+        # results never keep plugin instances alive
+        cache: "OrderedDict[Any, Any]" = OrderedDict()
+        code = getattr(func, "__code__", None)
+        skip = 1 if code is not None and code.co_argcount and code.co_varnames[0] == "self" else 0
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+            try:
+                key = (_freeze(args[skip:]), _freeze(kwargs))
+                result = cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                # Unhashable arguments can't be memoized
+                return func(*args, **kwargs)
+            else:
+                cache.move_to_end(key)
+                return result
+            
+            result = func(*args, **kwargs)
+            cache[key] = result
+            if len(cache) > cache_size:
+                cache.popitem(last=False)
+            return result
         
         wrapper._a2ui_template = func._a2ui_template
+        wrapper.cache_clear = cache.clear
         return wrapper
     
     return decorator
@@ -416,6 +531,11 @@ class A2UIBuilder:
         )
     """
     
+    __slots__ = (
+        "_type", "_name", "_description", "_category", "_icon",
+        "_props_schema", "_default_props", "_actions", "_style", "_children",
+    )
+    
     def __init__(self):
         self._type: str = "custom"
         self._name: str = ""
@@ -430,10 +550,7 @@ class A2UIBuilder:
     
     def type(self, component_type: Union[str, A2UIComponentType]) -> 'A2UIBuilder':
         """Set component type"""
-        if isinstance(component_type, A2UIComponentType):
-            self._type = component_type.value
-        else:
-            self._type = component_type
+        self._type = component_type
         return self
     
     def name(self, name: str) -> 'A2UIBuilder':
@@ -540,6 +657,30 @@ class A2UIBuilder:
             style=self._style,
             children=self._children if self._children else None,
         )
+    
+    def build_dict(self) -> Dict[str, Any]:
+        """Build the serialized component, same as build().to_dict()"""
+        result = {
+            "type": self._type,
+            "name": self._name,
+        }
+        if self._description:
+            result["description"] = self._description
+        if self._category:
+            result["category"] = self._category
+        if self._icon:
+            result["icon"] = self._icon
+        if self._props_schema:
+            result["propsSchema"] = self._props_schema
+        if self._default_props:
+            result["defaultProps"] = self._default_props
+        if self._actions:
+            result["actions"] = [a.to_dict() for a in self._actions]
+        if self._style:
+            result["style"] = self._style.to_dict()
+        if self._children:
+            result["children"] = [c.to_dict() for c in self._children]
+        return result
 
 
 # Convenience function for quick component creation
@@ -559,12 +700,13 @@ def component(
     Returns:
         Component dictionary
     """
-    if isinstance(component_type, A2UIComponentType):
-        type_str = component_type.value
-    else:
-        type_str = component_type
+    if not kwargs:
+        # Common case: build the whole dict as one literal
+        if props:
+            return {"type": component_type, "props": props}
+        return {"type": component_type}
     
-    result = {"type": type_str}
+    result = {"type": component_type}
     if props:
         result["props"] = props
     result.update(kwargs)
@@ -591,6 +733,7 @@ __all__ = [
     # Decorators
     "a2ui_component",
     "a2ui_template",
+    "invalidate_template",
     # Builder
     "A2UIBuilder",
     # Helpers
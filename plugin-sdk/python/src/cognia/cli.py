@@ -13,12 +13,15 @@ import argparse
 import json
 import os
 import sys
-import shutil
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
-import subprocess
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from .capability_contract import validate_capability_contract
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Plugin template files
 PLUGIN_TEMPLATE = '''"""
@@ -191,6 +194,18 @@ testpaths = ["tests"]
 '''
 
 
+# Manifest fields that must be present and non-empty, in reporting order
+_REQUIRED_MANIFEST_FIELDS = ("id", "name", "version", "description", "type")
+
+
+def _load_manifest(manifest_path: Path) -> Any:
+    """Read and parse plugin.json, using orjson when it is installed"""
+    data = manifest_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def to_class_name(name: str) -> str:
     """Convert plugin name to class name"""
     # Remove special characters and convert to PascalCase
@@ -207,6 +222,7 @@ def create_plugin(name: str, path: Optional[str] = None, description: str = "")
     """Create a new plugin from template"""
     plugin_id = to_plugin_id(name)
     class_name = to_class_name(name)
+    description = description or f"A Cognia plugin: {name}"
     
     # Determine target directory
     target_dir = Path(path) if path else Path.cwd() / plugin_id
@@ -215,51 +231,37 @@ def create_plugin(name: str, path: Optional[str] = None, description: str = "")
         print(f"Error: Directory '{target_dir}' already exists")
         sys.exit(1)
     
-    # Create directory structure
-    target_dir.mkdir(parents=True)
-    (target_dir / "tests").mkdir()
-    
-    # Create main.py
-    main_content = PLUGIN_TEMPLATE.format(
-        name=name,
-        plugin_id=plugin_id,
-        class_name=class_name,
-        description=description or f"A Cognia plugin: {name}",
-    )
-    (target_dir / "main.py").write_text(main_content)
-    
-    # Create plugin.json
-    manifest = MANIFEST_TEMPLATE.copy()
-    manifest["id"] = plugin_id
-    manifest["name"] = name
-    manifest["description"] = description or f"A Cognia plugin: {name}"
-    (target_dir / "plugin.json").write_text(json.dumps(manifest, indent=2))
-    
-    # Create README.md
-    readme_content = README_TEMPLATE.format(
-        name=name,
-        description=description or f"A Cognia plugin: {name}",
-    )
-    (target_dir / "README.md").write_text(readme_content)
-    
-    # Create test file
-    test_content = TEST_TEMPLATE.format(
-        name=name,
-        plugin_id=plugin_id,
-        class_name=class_name,
-    )
-    (target_dir / "tests" / "test_main.py").write_text(test_content)
-    
-    # Create pyproject.toml
-    pyproject_content = PYPROJECT_TEMPLATE.format(
-        plugin_id=plugin_id,
-        description=description or f"A Cognia plugin: {name}",
-    )
-    (target_dir / "pyproject.toml").write_text(pyproject_content)
+    # Render every file before touching the disk, so a failure leaves nothing behind
+    manifest = {**MANIFEST_TEMPLATE, "id": plugin_id, "name": name, "description": description}
+    files = {
+        "main.py": PLUGIN_TEMPLATE.format(
+            name=name,
+            plugin_id=plugin_id,
+            class_name=class_name,
+            description=description,
+        ),
+        "plugin.json": json.dumps(manifest, indent=2, ensure_ascii=False),
+        "README.md": README_TEMPLATE.format(
+            name=name,
+            description=description,
+        ),
+        "tests/test_main.py": TEST_TEMPLATE.format(
+            name=name,
+            plugin_id=plugin_id,
+            class_name=class_name,
+        ),
+        "pyproject.toml": PYPROJECT_TEMPLATE.format(
+            plugin_id=plugin_id,
+            description=description,
+        ),
+        "__init__.py": f'from .main import {class_name}\n',
+        "tests/__init__.py": "",
+    }
     
-    # Create __init__.py files
-    (target_dir / "__init__.py").write_text(f'from .main import {class_name}\n')
-    (target_dir / "tests" / "__init__.py").write_text("")
+    # Create directory structure, then write all files in one pass
+    (target_dir / "tests").mkdir(parents=True)
+    for rel_path, content in files.items():
+        (target_dir / rel_path).write_text(content, encoding="utf-8")
     
     print(f"✅ Created plugin '{name}' at {target_dir}")
     print(f"\nNext steps:")
@@ -280,12 +282,10 @@ def generate_manifest(path: Optional[str] = None, validate_only: bool = False) -
             sys.exit(1)
         
         try:
-            with open(manifest_path) as f:
-                manifest = json.load(f)
+            manifest = _load_manifest(manifest_path)
             
             # Validate required fields
-            required = ["id", "name", "version", "description", "type"]
-            missing = [f for f in required if not manifest.get(f)]
+            missing = [f for f in _REQUIRED_MANIFEST_FIELDS if not manifest.get(f)]
             if missing:
                 print(f"❌ Missing required fields: {', '.join(missing)}")
                 sys.exit(1)
@@ -341,25 +341,24 @@ def generate_manifest(path: Optional[str] = None, validate_only: bool = False) -
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
                 
-                # Find Plugin subclass
+                # Find Plugin subclass: the __plugin__ export, else the first
+                # subclass defined in main.py, else any imported subclass
                 from .plugin import Plugin
-                plugin_class = None
-                for name in dir(module):
-                    obj = getattr(module, name)
-                    if isinstance(obj, type) and issubclass(obj, Plugin) and obj is not Plugin:
-                        plugin_class = obj
-                        break
+                plugin_class = getattr(module, "__plugin__", None)
+                if not (isinstance(plugin_class, type) and issubclass(plugin_class, Plugin)):
+                    candidates = [
+                        obj for obj in vars(module).values()
+                        if isinstance(obj, type) and issubclass(obj, Plugin) and obj is not Plugin
+                    ]
+                    local = [obj for obj in candidates if obj.__module__ == module.__name__]
+                    plugin_class = (local or candidates or [None])[0]
                 
                 if not plugin_class:
                     print("Error: No Plugin subclass found in main.py")
                     sys.exit(1)
                 
-                # Generate manifest
-                manifest = plugin_class.generate_manifest()
-                
-                # Write manifest
-                with open(manifest_path, "w") as f:
-                    json.dump(manifest, f, indent=2)
+                # Generate and write manifest
+                plugin_class.generate_manifest_file(str(manifest_path))
                 
                 print(f"✅ Generated plugin.json")
         except Exception as e:
@@ -369,7 +368,7 @@ def generate_manifest(path: Optional[str] = None, validate_only: bool = False) -
             sys.path.pop(0)
 
 
-def run_tests(path: Optional[str] = None, verbose: bool = False) -> None:
+def run_tests(path: Optional[str] = None, verbose: bool = False, isolated: bool = False) -> None:
     """Run plugin tests"""
     target_dir = Path(path) if path else Path.cwd()
     test_dir = target_dir / "tests"
@@ -378,17 +377,83 @@ def run_tests(path: Optional[str] = None, verbose: bool = False) -> None:
         print(f"Error: tests directory not found at {test_dir}")
         sys.exit(1)
     
-    # Run pytest
-    cmd = ["python", "-m", "pytest", str(test_dir)]
+    args = [str(test_dir)]
     if verbose:
-        cmd.append("-v")
+        args.append("-v")
     
-    result = subprocess.run(cmd, cwd=str(target_dir))
-    sys.exit(result.returncode)
-
-
-def pack_plugin(path: Optional[str] = None, output: Optional[str] = None) -> None:
-    """Package plugin for distribution"""
+    pytest = None
+    if not isolated:
+        try:
+            import pytest
+        except ImportError:
+            pass
+    
+    if pytest is None:
+        # A child interpreter survives crashing extensions and can see a
+        # pytest installed outside this environment
+        import subprocess
+        
+        result = subprocess.run(["python", "-m", "pytest", *args], cwd=str(target_dir))
+        sys.exit(result.returncode)
+    
+    # Run in-process, with the same cwd and sys.path entry `python -m` would use
+    previous_cwd = os.getcwd()
+    sys.path.insert(0, str(target_dir))
+    os.chdir(target_dir)
+    try:
+        code = pytest.main(args)
+    finally:
+        os.chdir(previous_cwd)
+        sys.path.remove(str(target_dir))
+    sys.exit(int(code))
+
+
+# Files and directories left out of packages: exact names and name suffixes
+_PACK_EXCLUDE_NAMES = frozenset({
+    "__pycache__",
+    ".git",
+    ".venv",
+    "venv",
+    "dist",
+    "build",
+    ".pytest_cache",
+    ".coverage",
+})
+_PACK_EXCLUDE_SUFFIXES = (".pyc", ".egg-info")
+
+# Already-compressed formats are stored as-is; deflating them costs CPU for no gain
+_PACK_STORED_SUFFIXES = (
+    ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    ".zip", ".whl", ".gz", ".so", ".pyd", ".woff2",
+)
+
+_PACK_WRITE_BUFFER = 1 << 20
+
+
+def _iter_pack_files(target_dir: Path, skip: Optional[Path] = None) -> Iterator[Tuple[str, str]]:
+    """Yield (path, archive name) for every file to package, in sorted order"""
+    skip_path = os.path.abspath(skip) if skip is not None else None
+    for root, dirs, files in os.walk(target_dir):
+        # Prune excluded directories in place so os.walk never descends into them
+        dirs[:] = sorted(
+            d for d in dirs
+            if d not in _PACK_EXCLUDE_NAMES and not d.endswith(_PACK_EXCLUDE_SUFFIXES)
+        )
+        for name in sorted(files):
+            if name in _PACK_EXCLUDE_NAMES or name.endswith(_PACK_EXCLUDE_SUFFIXES):
+                continue
+            file_path = os.path.join(root, name)
+            if skip_path is not None and os.path.abspath(file_path) == skip_path:
+                continue
+            yield file_path, os.path.relpath(file_path, target_dir)
+
+
+def pack_plugin(
+    path: Optional[str] = None,
+    output: Optional[str] = None,
+    compresslevel: Optional[int] = None,
+) -> None:
+    """Package plugin for distribution (compresslevel 0-9, None for zlib's default)"""
     target_dir = Path(path) if path else Path.cwd()
     manifest_path = target_dir / "plugin.json"
     
@@ -397,8 +462,7 @@ def pack_plugin(path: Optional[str] = None, output: Optional[str] = None) -> Non
         sys.exit(1)
     
     # Load manifest
-    with open(manifest_path) as f:
-        manifest = json.load(f)
+    manifest = _load_manifest(manifest_path)
 
     if manifest.get("type") in {"python", "hybrid"} and not manifest.get("pythonMain"):
         print("Error: plugin.json must include pythonMain for python/hybrid plugin")
@@ -440,52 +504,38 @@ def pack_plugin(path: Optional[str] = None, output: Optional[str] = None) -> Non
     # Create zip archive
     import zipfile
     
-    # Files to exclude
-    exclude_patterns = [
-        "__pycache__",
-        "*.pyc",
-        ".git",
-        ".venv",
-        "venv",
-        "dist",
-        "build",
-        "*.egg-info",
-        ".pytest_cache",
-        ".coverage",
-    ]
-    
-    def should_exclude(path: Path) -> bool:
-        name = path.name
-        for pattern in exclude_patterns:
-            if pattern.startswith("*"):
-                if name.endswith(pattern[1:]):
-                    return True
-            elif name == pattern:
-                return True
-        return False
-    
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file_path in target_dir.rglob("*"):
-            if file_path.is_file() and not should_exclude(file_path):
-                # Check parent directories too
-                if any(should_exclude(p) for p in file_path.parents):
-                    continue
-                rel_path = file_path.relative_to(target_dir)
+    # A large write buffer batches zipfile's many small header/chunk writes
+    with open(output_path, "wb", buffering=_PACK_WRITE_BUFFER) as out, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+        for file_path, rel_path in _iter_pack_files(target_dir, skip=output_path):
+            if file_path.lower().endswith(_PACK_STORED_SUFFIXES):
+                zf.write(file_path, rel_path, compress_type=zipfile.ZIP_STORED)
+            else:
                 zf.write(file_path, rel_path)
     
     print(f"✅ Created package: {output_path}")
 
 
+_DEV_FILE_SUFFIXES = (".py", ".json", ".toml", ".yaml", ".yml")
+_DEV_IGNORED_DIRS = frozenset({"__pycache__", ".git", ".venv", "venv", "dist"})
+
+
+def _is_dev_file(file_path: Path, target_dir: Path) -> bool:
+    """Check whether a path is a watched plugin development file."""
+    if not file_path.name.endswith(_DEV_FILE_SUFFIXES):
+        return False
+    try:
+        parts = file_path.relative_to(target_dir).parts
+    except ValueError:
+        parts = file_path.parts
+    return not any(part in _DEV_IGNORED_DIRS for part in parts)
+
+
 def _snapshot_dev_files(target_dir: Path) -> Dict[str, float]:
     """Collect plugin development files and mtime snapshot."""
-    patterns = ("*.py", "*.json", "*.toml", "*.yaml", "*.yml")
     snapshot: Dict[str, float] = {}
     for file_path in target_dir.rglob("*"):
-        if not file_path.is_file():
-            continue
-        if any(part in {"__pycache__", ".git", ".venv", "venv", "dist"} for part in file_path.parts):
-            continue
-        if not any(file_path.match(pattern) for pattern in patterns):
+        if not _is_dev_file(file_path, target_dir) or not file_path.is_file():
             continue
         try:
             snapshot[str(file_path)] = file_path.stat().st_mtime
@@ -518,13 +568,13 @@ def start_dev_server(
     initial_snapshot: Optional[Dict[str, float]] = None,
 ) -> Dict[str, float]:
     """Start development watcher for plugin reload workflow."""
-    target_dir = Path(path) if path else Path.cwd()
+    # Resolved so it matches the absolute paths watchfiles reports
+    target_dir = Path(path).resolve() if path else Path.cwd().resolve()
     manifest_path = target_dir / "plugin.json"
     plugin_id = "plugin"
     if manifest_path.exists():
         try:
-            with open(manifest_path) as f:
-                plugin_id = json.load(f).get("id", plugin_id)
+            plugin_id = _load_manifest(manifest_path).get("id", plugin_id)
         except Exception:
             plugin_id = "plugin"
     
@@ -532,6 +582,37 @@ def start_dev_server(
     print(f"Watching for changes on port {port}...")
     print(f"Press Ctrl+C to stop")
     
+    def report(changed_files: List[str]) -> None:
+        for changed in changed_files:
+            try:
+                rel_path = str(Path(changed).relative_to(target_dir))
+            except ValueError:
+                rel_path = changed
+            print(f"[dev] change detected: {rel_path}")
+            if on_change:
+                on_change(rel_path)
+            if on_event:
+                on_event(create_dev_reload_event(plugin_id, rel_path, ok=True))
+        print("[dev] trigger reload")
+
+    # Unbounded sessions block on OS file events when watchfiles is installed
+    # instead of waking up every poll interval
+    if max_cycles is None:
+        try:
+            from watchfiles import watch
+        except ImportError:
+            watch = None
+        if watch is not None:
+            try:
+                for changes in watch(
+                    target_dir,
+                    watch_filter=lambda _change, changed: _is_dev_file(Path(changed), target_dir),
+                ):
+                    report(sorted({changed for _change, changed in changes}))
+            except KeyboardInterrupt:
+                print("\nStopped development server")
+            return _snapshot_dev_files(target_dir)
+
     previous_snapshot = initial_snapshot if initial_snapshot is not None else _snapshot_dev_files(target_dir)
     cycles = 0
 
@@ -551,15 +632,7 @@ def start_dev_server(
             changed_files.extend(removed_files)
 
             if changed_files:
-                changed_files = sorted(set(changed_files))
-                for changed in changed_files:
-                    rel_path = str(Path(changed).relative_to(target_dir)) if changed.startswith(str(target_dir)) else changed
-                    print(f"[dev] change detected: {rel_path}")
-                    if on_change:
-                        on_change(rel_path)
-                    if on_event:
-                        on_event(create_dev_reload_event(plugin_id, rel_path, ok=True))
-                print("[dev] trigger reload")
+                report(sorted(set(changed_files)))
 
             previous_snapshot = current_snapshot
             cycles += 1
@@ -571,8 +644,19 @@ def start_dev_server(
     return previous_snapshot
 
 
+def _print_version() -> None:
+    """Print the SDK version"""
+    from . import __version__
+    print(f"Cognia Plugin SDK v{__version__}")
+
+
 def main() -> None:
     """Main CLI entry point"""
+    # Plain `cognia version` doesn't need the parser
+    if sys.argv[1:] == ["version"]:
+        _print_version()
+        return
+    
     parser = argparse.ArgumentParser(
         prog="cognia",
         description="Cognia Plugin SDK CLI",
@@ -594,11 +678,19 @@ def main() -> None:
     test_parser = subparsers.add_parser("test", help="Run plugin tests")
     test_parser.add_argument("-p", "--path", help="Plugin directory")
     test_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    test_parser.add_argument("--isolated", action="store_true", help="Run pytest in a separate interpreter")
     
     # pack command
     pack_parser = subparsers.add_parser("pack", help="Package plugin for distribution")
     pack_parser.add_argument("-p", "--path", help="Plugin directory")
     pack_parser.add_argument("-o", "--output", help="Output file path")
+    pack_parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(10),
+        metavar="0-9",
+        help="Deflate level (1 is fastest, 9 smallest; default 6)",
+    )
     
     # dev command
     dev_parser = subparsers.add_parser("dev", help="Start development server")
@@ -615,14 +707,13 @@ def main() -> None:
     elif args.command == "manifest":
         generate_manifest(args.path, args.validate)
     elif args.command == "test":
-        run_tests(args.path, args.verbose)
+        run_tests(args.path, args.verbose, args.isolated)
     elif args.command == "pack":
-        pack_plugin(args.path, args.output)
+        pack_plugin(args.path, args.output, args.compresslevel)
     elif args.command == "dev":
         start_dev_server(args.path, args.port)
     elif args.command == "version":
-        from . import __version__
-        print(f"Cognia Plugin SDK v{__version__}")
+        _print_version()
     else:
         parser.print_help()
 
@@ -2,11 +2,17 @@
 Extended Plugin Context APIs for Cognia Plugin SDK
 
 Provides comprehensive APIs matching the TypeScript PluginContext and ExtendedPluginContext.
+
+The API base classes declare empty __slots__, so implementations that also
+declare __slots__ carry no per-instance __dict__.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar, AsyncIterator
-from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Iterable, List, Mapping, Optional, Sequence, TypeVar, AsyncIterator, Union
+from dataclasses import dataclass, field, replace
+from functools import partial
 
 from .types import (
     Session, UIMessage, SessionFilter, MessageQueryOptions, SendMessageOptions, SessionStats,
@@ -26,11 +32,34 @@ from .types import (
     ContextMenuItem, ContextMenuClickContext,
     ShortcutOptions, ShortcutRegistration,
     WindowOptions,
+    _LOG_DEBUG, _LOG_INFO, _LOG_WARN, _LOG_ERROR,
 )
 
+if TYPE_CHECKING:
+    import numpy
+
 T = TypeVar('T')
 
 
+async def _paginate(fetch: Callable[[Any], Any], query: Any, batch_size: int) -> AsyncIterator[Any]:
+    """Page through a limit/offset list call, honouring the query's own limit and offset"""
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    remaining = query.limit
+    offset = query.offset or 0
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        page = await fetch(replace(query, limit=size, offset=offset))
+        for item in page:
+            yield item
+        # A short page is the last one; a long one means the host ignored paging
+        if len(page) != size:
+            return
+        offset += size
+        if remaining is not None:
+            remaining -= size
+
+
 # =============================================================================
 # Session API
 # =============================================================================
@@ -38,6 +67,8 @@ T = TypeVar('T')
 class SessionAPI(ABC):
     """Session management API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_current_session(self) -> Optional[Session]:
         """Get the currently active session"""
@@ -78,11 +109,27 @@ class SessionAPI(ABC):
         """List sessions with optional filtering"""
         pass
     
+    async def iter_sessions(self, filter: Optional[SessionFilter] = None, batch_size: int = 100) -> AsyncIterator[Session]:
+        """
+        Iterate sessions, fetching them from list_sessions batch_size at a time.
+        
+        Only one page is held in memory and iteration can stop early; a limit
+        or offset set on the filter still applies to the whole iteration.
+        """
+        async for session in _paginate(self.list_sessions, filter or SessionFilter(), batch_size):
+            yield session
+    
     @abstractmethod
     async def get_messages(self, session_id: str, options: Optional[MessageQueryOptions] = None) -> List[UIMessage]:
         """Get messages for a session"""
         pass
     
+    async def iter_messages(self, session_id: str, options: Optional[MessageQueryOptions] = None, batch_size: int = 100) -> AsyncIterator[UIMessage]:
+        """Iterate a session's messages, fetching them from get_messages batch_size at a time"""
+        fetch = partial(self.get_messages, session_id)
+        async for message in _paginate(fetch, options or MessageQueryOptions(), batch_size):
+            yield message
+    
     @abstractmethod
     async def add_message(self, session_id: str, content: str, options: Optional[SendMessageOptions] = None) -> UIMessage:
         """Add a message to a session"""
@@ -121,6 +168,8 @@ class SessionAPI(ABC):
 class ProjectAPI(ABC):
     """Project management API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_current_project(self) -> Optional[Project]:
         """Get the currently active project"""
@@ -161,6 +210,11 @@ class ProjectAPI(ABC):
         """List projects with optional filtering"""
         pass
     
+    async def iter_projects(self, filter: Optional[ProjectFilter] = None, batch_size: int = 100) -> AsyncIterator[Project]:
+        """Iterate projects, fetching them from list_projects batch_size at a time"""
+        async for project in _paginate(self.list_projects, filter or ProjectFilter(), batch_size):
+            yield project
+    
     @abstractmethod
     async def archive_project(self, project_id: str) -> None:
         """Archive a project"""
@@ -229,6 +283,8 @@ class ProjectAPI(ABC):
 class VectorAPI(ABC):
     """Vector/RAG API for semantic search and retrieval"""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def create_collection(self, name: str, options: Optional[CollectionOptions] = None) -> str:
         """Create a new collection"""
@@ -274,6 +330,26 @@ class VectorAPI(ABC):
         """Search with a pre-computed embedding"""
         pass
     
+    async def search_batch(
+        self,
+        collection: str,
+        embeddings: Sequence[Sequence[float]],
+        options: Optional[VectorSearchOptions] = None,
+    ) -> List[List[VectorSearchResult]]:
+        """
+        Search with several pre-computed embeddings at once.
+        
+        The queries are issued concurrently, so N searches cost roughly one
+        round trip instead of N. Accepts a list of vectors or anything with
+        tolist() (e.g. a 2-D numpy array); results are in query order.
+        """
+        if hasattr(embeddings, "tolist"):
+            embeddings = embeddings.tolist()
+        return list(await asyncio.gather(*(
+            self.search_by_embedding(collection, list(embedding), options)
+            for embedding in embeddings
+        )))
+    
     @abstractmethod
     async def embed(self, text: str) -> List[float]:
         """Generate embedding for text"""
@@ -284,6 +360,24 @@ class VectorAPI(ABC):
         """Generate embeddings for multiple texts"""
         pass
     
+    async def stream_embed(self, texts: Iterable[str], batch_size: int = 64) -> AsyncIterator[List[List[float]]]:
+        """
+        Embed texts in batches of at most batch_size, yielding each batch.
+        
+        Accepts any iterable (including generators), so a large corpus never
+        has to be held in memory, as texts or as embeddings, all at once.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        batch: List[str] = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) == batch_size:
+                yield await self.embed_batch(batch)
+                batch = []
+        if batch:
+            yield await self.embed_batch(batch)
+    
     @abstractmethod
     async def get_document_count(self, collection: str) -> int:
         """Get document count in a collection"""
@@ -302,6 +396,8 @@ class VectorAPI(ABC):
 class ThemeAPI(ABC):
     """Theme customization API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_theme(self) -> ThemeState:
         """Get current theme state"""
@@ -394,6 +490,8 @@ class ThemeAPI(ABC):
 class ExportAPI(ABC):
     """Export API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def export_session(self, session_id: str, options: ExportOptions) -> ExportResult:
         """Export a session"""
@@ -450,6 +548,8 @@ class ExportAPI(ABC):
 class CanvasAPI(ABC):
     """Canvas editing API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_current_document(self) -> Optional[CanvasDocument]:
         """Get current canvas document"""
@@ -548,6 +648,8 @@ class CanvasAPI(ABC):
 class ArtifactAPI(ABC):
     """Artifact management API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_active_artifact(self) -> Optional[Artifact]:
         """Get active artifact"""
@@ -614,6 +716,8 @@ class ArtifactAPI(ABC):
 class NotificationCenterAPI(ABC):
     """Notification Center API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def create(self, options: NotificationOptions) -> str:
         """Create a notification"""
@@ -658,25 +762,66 @@ class NotificationCenterAPI(ABC):
 
 @dataclass
 class ProgressNotification:
-    """Progress notification helper"""
+    """
+    Progress notification helper.
+    
+    Updates arriving less than min_interval seconds after the last one sent
+    are coalesced; the latest value is sent when the interval ends, so tight
+    loops can report every item without flooding the host. A final update
+    (progress >= 1.0) is always sent immediately. The event loop may stop
+    before a held-back update goes out, so call flush() or complete() when
+    the work ends early.
+    """
     id: str
     api: NotificationCenterAPI
+    min_interval: float = 0.016
+    _last_sent: float = field(default=float("-inf"), init=False, repr=False)
+    _pending: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _timer: Optional[asyncio.TimerHandle] = field(default=None, init=False, repr=False)
     
     def update(self, progress: float, message: Optional[str] = None) -> None:
         """Update progress"""
         updates: Dict[str, Any] = {"progress": progress}
         if message:
             updates["message"] = message
+        if self._pending is not None:
+            # Keep a message from a coalesced update if this one has none
+            updates = {**self._pending, **updates}
+        
+        wait = self._last_sent + self.min_interval - time.monotonic()
+        if wait > 0 and progress < 1.0:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                self._pending = updates
+                if self._timer is None:
+                    self._timer = loop.call_later(wait, self.flush)
+                return
+        self._send(updates)
+    
+    def flush(self) -> None:
+        """Send a coalesced update now, if one is waiting"""
+        if self._pending is not None:
+            self._send(self._pending)
+    
+    def _send(self, updates: Dict[str, Any]) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = None
+        self._last_sent = time.monotonic()
         self.api.update(self.id, **updates)
     
     def complete(self, message: Optional[str] = None) -> None:
         """Complete the progress"""
-        self.update(1.0, message or "Complete")
+        self._send({"progress": 1.0, "message": message or "Complete"})
         self.api.dismiss(self.id)
     
     def error(self, message: str) -> None:
         """Mark as error"""
-        self.api.update(self.id, type="error", message=message)
+        self._send({"type": "error", "message": message})
 
 
 # =============================================================================
@@ -686,6 +831,8 @@ class ProgressNotification:
 class AIProviderAPI(ABC):
     """AI Provider API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_available_models(self) -> List[AIModel]:
         """Get available models"""
@@ -706,6 +853,32 @@ class AIProviderAPI(ABC):
         """Generate embeddings"""
         pass
     
+    async def embed_array(self, texts: Sequence[str], batch_size: int = 64) -> "numpy.ndarray":
+        """
+        Embed texts into a float32 numpy array of shape (len(texts), dim).
+        
+        Texts are embedded batch_size at a time and copied into the array as
+        each batch arrives, so at most one batch of Python floats is alive at
+        once. Requires numpy. Raises ValueError if embed() returns a different
+        number of vectors than texts it was given.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        import numpy as np
+        
+        result = None
+        for start in range(0, len(texts), batch_size):
+            chunk = list(texts[start:start + batch_size])
+            batch = await self.embed(chunk)
+            if len(batch) != len(chunk):
+                raise ValueError(
+                    f"embed() returned {len(batch)} vectors for {len(chunk)} texts"
+                )
+            if result is None:
+                result = np.empty((len(texts), len(batch[0])), dtype=np.float32)
+            result[start:start + len(batch)] = batch
+        return result if result is not None else np.empty((0, 0), dtype=np.float32)
+    
     @abstractmethod
     def get_default_model(self) -> str:
         """Get current default model"""
@@ -724,6 +897,8 @@ class AIProviderAPI(ABC):
 class PermissionAPI(ABC):
     """Permission management API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def has_permission(self, permission: ExtendedPermission) -> bool:
         """Check if plugin has a permission"""
@@ -739,15 +914,13 @@ class PermissionAPI(ABC):
         """Get all granted permissions"""
         pass
     
-    @abstractmethod
     def has_all_permissions(self, permissions: List[ExtendedPermission]) -> bool:
         """Check multiple permissions"""
-        pass
+        return set(self.get_granted_permissions()).issuperset(permissions)
     
-    @abstractmethod
     def has_any_permission(self, permissions: List[ExtendedPermission]) -> bool:
         """Check if any permission is granted"""
-        pass
+        return not set(self.get_granted_permissions()).isdisjoint(permissions)
 
 
 # =============================================================================
@@ -757,6 +930,8 @@ class PermissionAPI(ABC):
 class NetworkAPI(ABC):
     """Network API for HTTP requests"""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def get(self, url: str, options: Optional[NetworkRequestOptions] = None) -> NetworkResponse:
         """Make a GET request"""
@@ -805,6 +980,8 @@ class NetworkAPI(ABC):
 class FileSystemAPI(ABC):
     """File System API for file operations"""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def read_text(self, path: str) -> str:
         """Read file as text"""
@@ -875,6 +1052,27 @@ class FileSystemAPI(ABC):
         """Get file/directory info"""
         pass
     
+    async def read_many(self, paths: Sequence[str], binary: bool = False) -> List[Union[str, bytes]]:
+        """
+        Read several files at once, returning contents in path order.
+        
+        The reads are issued concurrently, so bulk I/O costs roughly one
+        round trip to the host instead of one per file.
+        """
+        read = self.read_binary if binary else self.read_text
+        return list(await asyncio.gather(*(read(path) for path in paths)))
+    
+    async def write_many(self, files: Mapping[str, Union[str, bytes]]) -> None:
+        """Write several files at once; bytes contents are written as binary"""
+        await asyncio.gather(*(
+            self.write_binary(path, content) if isinstance(content, bytes) else self.write_text(path, content)
+            for path, content in files.items()
+        ))
+    
+    async def stat_many(self, paths: Sequence[str]) -> List[FileStat]:
+        """Get info for several paths at once, in path order"""
+        return list(await asyncio.gather(*(self.stat(path) for path in paths)))
+    
     @abstractmethod
     def watch(self, path: str, callback: Callable[[FileWatchEvent], None]) -> Callable[[], None]:
         """Watch for file changes"""
@@ -903,6 +1101,8 @@ class FileSystemAPI(ABC):
 class ShellAPI(ABC):
     """Shell API for command execution"""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def execute(self, command: str, options: Optional[ShellOptions] = None) -> ShellResult:
         """Execute a shell command"""
@@ -941,6 +1141,8 @@ class ShellAPI(ABC):
 class DatabaseAPI(ABC):
     """Database API for local database operations"""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def query(self, sql: str, params: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
         """Execute a query"""
@@ -974,6 +1176,8 @@ class DatabaseAPI(ABC):
 class ShortcutsAPI(ABC):
     """Keyboard Shortcuts API"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def register(self, shortcut: str, callback: Callable[[], None], options: Optional[ShortcutOptions] = None) -> Callable[[], None]:
         """Register a global keyboard shortcut"""
@@ -1002,6 +1206,8 @@ class ShortcutsAPI(ABC):
 class ContextMenuAPI(ABC):
     """Context Menu API"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def register(self, item: ContextMenuItem) -> Callable[[], None]:
         """Register a context menu item"""
@@ -1020,6 +1226,8 @@ class ContextMenuAPI(ABC):
 class StorageAPI(ABC):
     """Plugin storage API"""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def get(self, key: str) -> Optional[Any]:
         """Get value by key"""
@@ -1030,6 +1238,20 @@ class StorageAPI(ABC):
         """Set value by key"""
         pass
     
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, Optional[Any]]:
+        """Get several values at once, keyed by storage key"""
+        values = await asyncio.gather(*(self.get(key) for key in keys))
+        return dict(zip(keys, values))
+    
+    async def set_many(self, items: Mapping[str, Any]) -> None:
+        """
+        Set several values at once.
+        
+        The writes are issued concurrently, so a batch costs roughly one
+        round trip to the host instead of one per key.
+        """
+        await asyncio.gather(*(self.set(key, value) for key, value in items.items()))
+    
     @abstractmethod
     async def delete(self, key: str) -> None:
         """Delete value by key"""
@@ -1053,6 +1275,8 @@ class StorageAPI(ABC):
 class EventsAPI(ABC):
     """Plugin event emitter API"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def on(self, event: str, handler: Callable[..., None]) -> Callable[[], None]:
         """Subscribe to an event"""
@@ -1119,6 +1343,8 @@ class StatusBarItem:
 class UIAPI(ABC):
     """UI API for plugins"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def show_notification(self, title: str, body: str, icon: Optional[str] = None, timeout: Optional[int] = None) -> None:
         """Show a system notification"""
@@ -1157,6 +1383,8 @@ class UIAPI(ABC):
 class SecretsAPI(ABC):
     """Secrets API for secure storage"""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def get(self, key: str) -> Optional[str]:
         """Get a secret by key"""
@@ -1185,6 +1413,8 @@ class SecretsAPI(ABC):
 class I18nAPI(ABC):
     """Internationalization API"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_current_locale(self) -> str:
         """Get current locale"""
@@ -1272,19 +1502,26 @@ class ExtendedPluginContext:
     secrets: Optional[SecretsAPI] = None
     i18n: Optional[I18nAPI] = None
     
-    # Logger
-    def log_debug(self, message: str) -> None:
-        """Log debug message"""
-        print(f"[DEBUG][{self.plugin_id}] {message}")
-    
-    def log_info(self, message: str) -> None:
-        """Log info message"""
-        print(f"[INFO][{self.plugin_id}] {message}")
+    # Messages below this level are dropped before any formatting
+    log_level: int = _LOG_DEBUG
     
-    def log_warn(self, message: str) -> None:
-        """Log warning message"""
-        print(f"[WARN][{self.plugin_id}] {message}")
-    
-    def log_error(self, message: str) -> None:
-        """Log error message"""
-        print(f"[ERROR][{self.plugin_id}] {message}")
+    # Logger
+    def log_debug(self, message: str, *args: Any) -> None:
+        """Log debug message, %-formatting ``args`` into it when given"""
+        if self.log_level <= _LOG_DEBUG:
+            print(f"[DEBUG][{self.plugin_id}] {message % args if args else message}")
+    
+    def log_info(self, message: str, *args: Any) -> None:
+        """Log info message, %-formatting ``args`` into it when given"""
+        if self.log_level <= _LOG_INFO:
+            print(f"[INFO][{self.plugin_id}] {message % args if args else message}")
+    
+    def log_warn(self, message: str, *args: Any) -> None:
+        """Log warning message, %-formatting ``args`` into it when given"""
+        if self.log_level <= _LOG_WARN:
+            print(f"[WARN][{self.plugin_id}] {message % args if args else message}")
+    
+    def log_error(self, message: str, *args: Any) -> None:
+        """Log error message, %-formatting ``args`` into it when given"""
+        if self.log_level <= _LOG_ERROR:
+            print(f"[ERROR][{self.plugin_id}] {message % args if args else message}")
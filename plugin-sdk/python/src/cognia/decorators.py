@@ -4,7 +4,6 @@ Decorators for Cognia Plugin SDK
 Provides @tool, @hook, and @command decorators for defining plugin functionality.
 """
 
-import functools
 import inspect
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 from enum import Enum
@@ -19,8 +18,11 @@ from .types import (
 F = TypeVar('F', bound=Callable[..., Any])
 
 
-class HookType(Enum):
-    """All available hook types for plugins"""
+class HookType(str, Enum):
+    """All available hook types for plugins (members are their hook names)"""
+    
+    __str__ = str.__str__
+    __format__ = str.__format__
     
     # Lifecycle Hooks
     ON_LOAD = "on_load"
@@ -124,8 +126,12 @@ class HookType(Enum):
     ON_SCHEDULED_TASK_RESUME = "on_scheduled_task_resume"
 
 
+# Hook name normalization: HookType members compare and hash equal to their
+# values, so one table maps both to the canonical plain string name
+_HOOK_NAMES: Dict[str, str] = {h.value: h.value for h in HookType}
+
 # List of all valid hook names for validation
-VALID_HOOKS = {h.value for h in HookType}
+VALID_HOOKS = frozenset(_HOOK_NAMES.values())
 
 
 def tool(
@@ -156,26 +162,43 @@ def tool(
         )
         async def analyze_data(self, file_path: str, columns: List[str] = None):
             ...
+    
+    May also be applied bare as ``@tool``, using all the defaults.
     """
+    if callable(name):
+        return tool()(name)
+    
     def decorator(func: F) -> F:
         tool_name = name or func.__name__
         
-        # Auto-detect parameters from type hints if not provided
-        tool_params = {}
+        # Auto-detect parameters from type hints if not provided. Parameters
+        # are built directly as their manifest dicts.
+        tool_params: Dict[str, Dict[str, Any]] = {}
         if parameters:
-            for param_name, param_def in parameters.items():
-                tool_params[param_name] = ToolParameter(
-                    name=param_name,
-                    type=param_def.get("type", "string"),
-                    description=param_def.get("description", ""),
-                    required=param_def.get("required", True),
-                    default=param_def.get("default"),
-                    enum=param_def.get("enum"),
+            param_defs = parameters
+            required_names = None
+            if _is_object_schema(parameters):
+                # Full JSON Schema, e.g. from schema.parameters()
+                param_defs = parameters["properties"]
+                required_names = parameters.get("required", [])
+            
+            for param_name, param_def in param_defs.items():
+                if required_names is None:
+                    required = param_def.get("required", True)
+                else:
+                    required = param_name in required_names
+                tool_params[param_name] = _param_dict(
+                    param_def.get("type", "string"),
+                    param_def.get("description", ""),
+                    required,
+                    param_def.get("default"),
+                    param_def.get("enum"),
                 )
         else:
             # Auto-detect from function signature
             sig = inspect.signature(func)
-            hints = func.__annotations__ if hasattr(func, '__annotations__') else {}
+            hints = getattr(func, '__annotations__', None) or {}
+            empty = inspect.Parameter.empty
             
             for param_name, param in sig.parameters.items():
                 if param_name == 'self':
@@ -186,29 +209,26 @@ def tool(
                     hint = hints[param_name]
                     param_type = _python_type_to_json_type(hint)
                 
-                tool_params[param_name] = ToolParameter(
-                    name=param_name,
-                    type=param_type,
-                    description="",
-                    required=param.default == inspect.Parameter.empty,
-                    default=None if param.default == inspect.Parameter.empty else param.default,
+                tool_params[param_name] = _param_dict(
+                    param_type,
+                    "",
+                    param.default is empty,
+                    None if param.default is empty else param.default,
                 )
         
-        # Attach metadata to function
+        # Attach metadata to function. The JSON Schema for the parameters is
+        # built once here for Plugin.generate_manifest_file; the host currently
+        # reads only "parameters".
         func._tool_metadata = {
             "name": tool_name,
             "description": description or func.__doc__ or "",
-            "parameters": {k: _param_to_dict(v) for k, v in tool_params.items()},
+            "parameters": tool_params,
+            "parameters_schema": _params_to_schema(tool_params),
             "requires_approval": requires_approval,
             "category": category,
         }
         
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        wrapper._tool_metadata = func._tool_metadata
-        return wrapper
+        return func
     
     return decorator
 
@@ -330,8 +350,8 @@ def hook(
     def decorator(func: F) -> F:
         is_async = inspect.iscoroutinefunction(func)
         
-        # Convert HookType enum to string
-        name = hook_name.value if isinstance(hook_name, HookType) else hook_name
+        # Normalize HookType enum or string to the hook name string
+        name = _HOOK_NAMES.get(hook_name, hook_name)
         
         func._hook_metadata = {
             "hook_name": name,
@@ -340,12 +360,7 @@ def hook(
             "filter": filter,
         }
         
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        wrapper._hook_metadata = func._hook_metadata
-        return wrapper
+        return func
     
     return decorator
 
@@ -371,7 +386,12 @@ def command(
         )
         def my_command(self, args: List[str]):
             ...
+    
+    May also be applied bare as ``@command``, using all the defaults.
     """
+    if callable(name):
+        return command()(name)
+    
     def decorator(func: F) -> F:
         cmd_name = name or func.__name__
         
@@ -381,31 +401,43 @@ def command(
             "shortcut": shortcut,
         }
         
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        wrapper._command_metadata = func._command_metadata
-        return wrapper
+        return func
     
     return decorator
 
 
+# JSON Schema types for plain built-in classes, looked up by the class itself
+_JSON_TYPE_BY_CLASS = {
+    str: 'string',
+    int: 'number',
+    float: 'number',
+    bool: 'boolean',
+    list: 'array',
+    dict: 'object',
+}
+
+# Fallback by type name, covering typing aliases such as List and Any
+_JSON_TYPE_BY_NAME = {
+    'str': 'string',
+    'int': 'number',
+    'float': 'number',
+    'bool': 'boolean',
+    'list': 'array',
+    'List': 'array',
+    'dict': 'object',
+    'Dict': 'object',
+    'Any': 'any',
+}
+
+
 def _python_type_to_json_type(python_type: Any) -> str:
     """Convert Python type hint to JSON Schema type"""
-    type_name = getattr(python_type, '__name__', str(python_type))
+    if type(python_type) is type:
+        json_type = _JSON_TYPE_BY_CLASS.get(python_type)
+        if json_type is not None:
+            return json_type
     
-    type_mapping = {
-        'str': 'string',
-        'int': 'number',
-        'float': 'number',
-        'bool': 'boolean',
-        'list': 'array',
-        'List': 'array',
-        'dict': 'object',
-        'Dict': 'object',
-        'Any': 'any',
-    }
+    type_name = getattr(python_type, '__name__', str(python_type))
     
     # Handle Optional types
     if hasattr(python_type, '__origin__'):
@@ -421,23 +453,51 @@ def _python_type_to_json_type(python_type: Any) -> str:
         elif origin is dict:
             return 'object'
     
-    return type_mapping.get(type_name, 'string')
+    return _JSON_TYPE_BY_NAME.get(type_name, 'string')
 
 
-def _param_to_dict(param: ToolParameter) -> Dict[str, Any]:
-    """Convert ToolParameter to dictionary"""
+def _is_object_schema(parameters: Dict[str, Any]) -> bool:
+    """Check if tool parameters are a full JSON Schema object definition"""
+    return parameters.get("type") == "object" and isinstance(parameters.get("properties"), dict)
+
+
+def _params_to_schema(params: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert tool parameter dicts to the JSON Schema used in plugin manifests"""
+    return {
+        "type": "object",
+        "properties": {
+            name: {"type": param["type"], "description": param["description"]}
+            for name, param in params.items()
+        },
+        "required": [name for name, param in params.items() if param["required"]],
+    }
+
+
+def _param_dict(
+    type: str,
+    description: str,
+    required: bool,
+    default: Any = None,
+    enum: Optional[List[Any]] = None,
+) -> Dict[str, Any]:
+    """Build the manifest dictionary for a single tool parameter"""
     result = {
-        "type": param.type,
-        "description": param.description,
-        "required": param.required,
+        "type": type,
+        "description": description,
+        "required": required,
     }
-    if param.default is not None:
-        result["default"] = param.default
-    if param.enum:
-        result["enum"] = param.enum
+    if default is not None:
+        result["default"] = default
+    if enum:
+        result["enum"] = enum
     return result
 
 
+def _param_to_dict(param: ToolParameter) -> Dict[str, Any]:
+    """Convert ToolParameter to dictionary"""
+    return _param_dict(param.type, param.description, param.required, param.default, param.enum)
+
+
 def scheduled(
     cron: Optional[str] = None,
     interval: Optional[int] = None,
@@ -543,11 +603,6 @@ def scheduled(
             "tags": tags,
         }
         
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        
-        wrapper._scheduled_metadata = func._scheduled_metadata
-        return wrapper
+        return func
     
     return decorator
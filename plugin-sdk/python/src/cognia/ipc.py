@@ -15,11 +15,34 @@ from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 from enum import Enum
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize an IPC message body, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # Values orjson rejects (e.g. ints beyond 64 bits) still go through json
+            pass
+    return json.dumps(obj)
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize an IPC message body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class IPCMode(Enum):
     """IPC communication mode"""
     SUBPROCESS = "subprocess"  # Default: communicate via subprocess stdio
@@ -121,7 +144,7 @@ class StdioTransport(IPCTransport):
         if message.error:
             msg_dict["error"] = message.error
         
-        line = json.dumps(msg_dict)
+        line = _json_dumps(msg_dict)
         # Write to stdout with newline
         sys.stdout.write(f"__COGNIA_IPC__{line}__END__\n")
         sys.stdout.flush()
@@ -132,7 +155,7 @@ class StdioTransport(IPCTransport):
             raise RuntimeError("Transport not connected")
         
         # Read line from stdin
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         line = await loop.run_in_executor(None, sys.stdin.readline)
         
         if not line:
@@ -145,9 +168,9 @@ class StdioTransport(IPCTransport):
         # Check for IPC marker
         if line.startswith("__COGNIA_IPC__") and line.endswith("__END__"):
             json_str = line[14:-7]  # Remove markers
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
         else:
-            data = json.loads(line)
+            data = _json_loads(line)
         
         return IPCMessage(
             id=data.get("id", ""),
@@ -197,7 +220,7 @@ class StdioTransport(IPCTransport):
     
     def register_pending(self, msg_id: str) -> asyncio.Future:
         """Register a pending response"""
-        future = asyncio.get_event_loop().create_future()
+        future = asyncio.get_running_loop().create_future()
         self._pending_responses[msg_id] = future
         return future
     
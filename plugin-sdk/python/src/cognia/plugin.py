@@ -17,26 +17,55 @@ from .types import (
 )
 
 
+_METADATA_ATTRS = ("_tool_metadata", "_hook_metadata", "_command_metadata")
+
+
+def _collect_decorated(members: Dict[str, Any], klass: type) -> None:
+    """Apply a class's own namespace to the decorated-member registry.
+    
+    Members defined on ``klass`` replace inherited entries of the same name,
+    and undecorated overrides remove them, matching normal attribute lookup.
+    """
+    for attr_name in vars(klass):
+        if attr_name.startswith('_'):
+            continue
+        
+        attr = getattr(klass, attr_name, None)
+        if attr is not None and any(hasattr(attr, key) for key in _METADATA_ATTRS):
+            members[attr_name] = attr
+        else:
+            members.pop(attr_name, None)
+
+
 class PluginMeta(ABCMeta):
     """
     Metaclass for Plugin that automatically collects tools and hooks.
     Inherits from ABCMeta to support abstract methods.
+    
+    Decorated members are recorded per class in ``_decorated_members``, so a
+    subclass only scans its own namespace on top of its base's registry.
     """
     def __new__(mcs, name: str, bases: tuple, namespace: dict) -> type:
         cls = super().__new__(mcs, name, bases, namespace)
         
+        base_members = bases[0].__dict__.get('_decorated_members') if len(bases) == 1 else None
+        if base_members is not None:
+            members = dict(base_members)
+            _collect_decorated(members, cls)
+        else:
+            # Root class or multiple inheritance: walk the full MRO once
+            members = {}
+            for klass in reversed(cls.__mro__):
+                _collect_decorated(members, klass)
+        cls._decorated_members = members
+        
         # Collect tools and hooks from methods
         tools = []
         hooks = []
         commands = []
         
-        for attr_name in dir(cls):
-            if attr_name.startswith('_'):
-                continue
-            
-            attr = getattr(cls, attr_name, None)
-            if attr is None:
-                continue
+        for attr_name in sorted(members):
+            attr = members[attr_name]
             
             if hasattr(attr, '_tool_metadata'):
                 tools.append(attr._tool_metadata)
@@ -76,6 +105,10 @@ class Plugin(metaclass=PluginMeta):
                 self.logger.info(f"Step: {step}")
     """
     
+    # Instance state lives in slots; subclasses that don't declare their own
+    # __slots__ still get a __dict__ for custom attributes.
+    __slots__ = ("_context", "_config", "_enabled")
+    
     # Plugin metadata - override in subclass
     name: str = ""
     version: str = "1.0.0"
@@ -87,6 +120,7 @@ class Plugin(metaclass=PluginMeta):
     python_dependencies: List[str] = []
     
     # Internal state
+    _decorated_members: Dict[str, Any] = {}
     _registered_tools: List[Dict[str, Any]] = []
     _registered_hooks: List[Dict[str, Any]] = []
     _registered_commands: List[Dict[str, Any]] = []
@@ -152,7 +186,7 @@ class Plugin(metaclass=PluginMeta):
             version=self.version,
             description=self.description,
             plugin_type=PluginType.PYTHON,
-            capabilities=self.capabilities or [PluginCapability.TOOLS],
+            capabilities=[PluginCapability(c) for c in self.capabilities] or [PluginCapability.TOOLS],
             python_dependencies=self.python_dependencies,
         )
     
@@ -182,28 +216,14 @@ class Plugin(metaclass=PluginMeta):
                 {
                     "name": t["name"],
                     "description": t["description"],
-                    "parametersSchema": {
-                        "type": "object",
-                        "properties": {
-                            name: {
-                                "type": param.get("type", "string"),
-                                "description": param.get("description", ""),
-                            }
-                            for name, param in t.get("parameters", {}).items()
-                        },
-                        "required": [
-                            name
-                            for name, param in t.get("parameters", {}).items()
-                            if param.get("required", True)
-                        ],
-                    },
+                    "parametersSchema": t["parameters_schema"],
                     "requiresApproval": t.get("requires_approval", False),
                 }
                 for t in instance._registered_tools
             ]
         
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(manifest_dict, f, indent=2)
+            json.dump(manifest_dict, f, indent=2, ensure_ascii=False)
         
         return output_path
 
@@ -6,8 +6,11 @@ that communicate with the Tauri backend via IPC.
 """
 
 import asyncio
-from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar, Union
+import itertools
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 import logging
 
 from .ipc import TauriIPC, get_ipc, IPCError
@@ -45,10 +48,15 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+# Buffered append_text: flush early once this many characters are pending
+_APPEND_FLUSH_SIZE = 64 * 1024
+
+
 def _to_dict(obj: Any) -> Any:
     """Convert dataclass to dict recursively"""
     if hasattr(obj, '__dataclass_fields__'):
-        return {k: _to_dict(v) for k, v in obj.__dict__.items() if v is not None}
+        values = ((f.name, getattr(obj, f.name)) for f in fields(obj))
+        return {k: _to_dict(v) for k, v in values if v is not None}
     elif isinstance(obj, list):
         return [_to_dict(item) for item in obj]
     elif isinstance(obj, dict):
@@ -378,36 +386,43 @@ class RuntimeEventsAPI(EventsAPI):
     
     def __init__(self, ipc: TauriIPC):
         self._ipc = ipc
-        self._handlers: Dict[str, List[Callable]] = {}
+        # event -> registration token -> (handler, IPC unsubscribe); tokens make
+        # the cleanup returned by on() O(1) and keep duplicate handlers distinct
+        self._handlers: Dict[str, Dict[int, Tuple[Callable, Callable[[], None]]]] = {}
+        self._tokens = itertools.count()
     
     def on(self, event: str, handler: Callable[..., None]) -> Callable[[], None]:
-        if event not in self._handlers:
-            self._handlers[event] = []
-        self._handlers[event].append(handler)
-        
+        token = next(self._tokens)
         # Also subscribe via IPC
         unsubscribe = self._ipc.listen(event, handler)
+        self._handlers.setdefault(event, {})[token] = (handler, unsubscribe)
         
         def cleanup():
-            try:
-                self._handlers[event].remove(handler)
-            except (KeyError, ValueError):
-                pass
-            unsubscribe()
+            self._remove(event, token)
         
         return cleanup
     
+    def _remove(self, event: str, token: int) -> None:
+        handlers = self._handlers.get(event)
+        if handlers is None:
+            return
+        entry = handlers.pop(token, None)
+        if not handlers:
+            del self._handlers[event]
+        if entry is not None:
+            entry[1]()
+    
     def off(self, event: str, handler: Callable[..., None]) -> None:
-        if event in self._handlers:
-            try:
-                self._handlers[event].remove(handler)
-            except ValueError:
-                pass
+        for token, (registered, _unsubscribe) in self._handlers.get(event, {}).items():
+            if registered == handler:
+                self._remove(event, token)
+                return
     
     def emit(self, event: str, *args: Any) -> None:
-        # Emit locally
-        if event in self._handlers:
-            for handler in self._handlers[event]:
+        # Emit locally; iterate a snapshot so handlers may subscribe or unsubscribe
+        handlers = self._handlers.get(event)
+        if handlers:
+            for handler, _unsubscribe in tuple(handlers.values()):
                 try:
                     handler(*args)
                 except Exception as e:
@@ -435,7 +450,7 @@ class RuntimeNetworkAPI(NetworkAPI):
         self._ipc = ipc
     
     async def get(self, url: str, options: Optional[NetworkRequestOptions] = None) -> NetworkResponse:
-        return await self.fetch(url, NetworkRequestOptions(method="GET", **(options.__dict__ if options else {})))
+        return await self.fetch(url, replace(options, method="GET") if options else NetworkRequestOptions(method="GET"))
     
     async def post(self, url: str, body: Any = None, options: Optional[NetworkRequestOptions] = None) -> NetworkResponse:
         opts = options or NetworkRequestOptions()
@@ -504,52 +519,136 @@ class RuntimeFileSystemAPI(FileSystemAPI):
     def __init__(self, ipc: TauriIPC, plugin_id: str):
         self._ipc = ipc
         self._plugin_id = plugin_id
+        # Pending append_text chunks per path inside buffered_appends()
+        self._append_buffers: Dict[str, List[str]] = {}
+        self._append_sizes: Dict[str, int] = {}
+        # buffered_appends() nesting depth, scoped to the calling task
+        self._buffering: ContextVar[int] = ContextVar(f"cognia_fs_buffering_{id(self)}", default=0)
+        # Held while buffered appends are being sent to the host
+        self._append_lock = asyncio.Lock()
     
     async def read_text(self, path: str) -> str:
+        await self._sync_appends()
         result = await self._ipc.invoke("fs_read_text", {"path": path})
         return result or ""
     
     async def read_binary(self, path: str) -> bytes:
+        await self._sync_appends()
         result = await self._ipc.invoke("fs_read_binary", {"path": path})
         return bytes(result) if result else b""
     
     async def read_json(self, path: str) -> Any:
+        await self._sync_appends()
         result = await self._ipc.invoke("fs_read_json", {"path": path})
         return result
     
     async def write_text(self, path: str, content: str) -> None:
+        await self._sync_appends()
         await self._ipc.invoke("fs_write_text", {"path": path, "content": content})
     
     async def write_binary(self, path: str, content: bytes) -> None:
+        await self._sync_appends()
         await self._ipc.invoke("fs_write_binary", {"path": path, "content": list(content)})
     
     async def write_json(self, path: str, data: Any, pretty: bool = True) -> None:
+        await self._sync_appends()
         await self._ipc.invoke("fs_write_json", {"path": path, "data": data, "pretty": pretty})
     
     async def append_text(self, path: str, content: str) -> None:
-        await self._ipc.invoke("fs_append_text", {"path": path, "content": content})
+        """
+        Append text to a file.
+        
+        The write completes before this returns, unless called inside
+        buffered_appends(), where small appends are coalesced into one
+        host call per path.
+        """
+        if not self._buffering.get():
+            await self._sync_appends()
+            await self._ipc.invoke("fs_append_text", {"path": path, "content": content})
+            return
+        
+        buffer = self._append_buffers.setdefault(path, [])
+        buffer.append(content)
+        size = self._append_sizes.get(path, 0) + len(content)
+        self._append_sizes[path] = size
+        if size >= _APPEND_FLUSH_SIZE:
+            await self.flush(path)
+    
+    @asynccontextmanager
+    async def buffered_appends(self) -> AsyncIterator[None]:
+        """
+        Coalesce append_text calls made inside the block.
+        
+        Only appends from the task that entered the block are buffered;
+        other tasks using the same API keep writing through. Pending appends are sent once enough text accumulates, before any
+        other filesystem call, and when the block exits.
+        
+        Example:
+            async with context.fs.buffered_appends():
+                for line in lines:
+                    await context.fs.append_text("log.txt", line)
+        """
+        depth = self._buffering.get()
+        token = self._buffering.set(depth + 1)
+        try:
+            yield
+        finally:
+            self._buffering.reset(token)
+            if not depth:
+                await self.flush()
+    
+    async def flush(self, path: Optional[str] = None) -> None:
+        """Send buffered appends for one path, or for every path"""
+        async with self._append_lock:
+            for pending in ([path] if path is not None else list(self._append_buffers)):
+                chunks = self._append_buffers.get(pending)
+                if not chunks:
+                    continue
+                # Chunks stay buffered until the host has them, so concurrent
+                # calls wait on the lock instead of overtaking the write
+                sent = len(chunks)
+                content = "".join(chunks)
+                await self._ipc.invoke("fs_append_text", {"path": pending, "content": content})
+                del chunks[:sent]
+                if chunks:
+                    self._append_sizes[pending] -= len(content)
+                else:
+                    del self._append_buffers[pending]
+                    del self._append_sizes[pending]
+    
+    async def _sync_appends(self) -> None:
+        """Make pending buffered appends visible before another filesystem call"""
+        if self._append_buffers or self._append_lock.locked():
+            await self.flush()
     
     async def exists(self, path: str) -> bool:
+        await self._sync_appends()
         result = await self._ipc.invoke("fs_exists", {"path": path})
         return bool(result)
     
     async def mkdir(self, path: str, recursive: bool = True) -> None:
+        await self._sync_appends()
         await self._ipc.invoke("fs_mkdir", {"path": path, "recursive": recursive})
     
     async def remove(self, path: str, recursive: bool = False) -> None:
+        await self._sync_appends()
         await self._ipc.invoke("fs_remove", {"path": path, "recursive": recursive})
     
     async def copy(self, src: str, dest: str) -> None:
+        await self._sync_appends()
         await self._ipc.invoke("fs_copy", {"src": src, "dest": dest})
     
     async def move(self, src: str, dest: str) -> None:
+        await self._sync_appends()
         await self._ipc.invoke("fs_move", {"src": src, "dest": dest})
     
     async def read_dir(self, path: str) -> List[FileEntry]:
+        await self._sync_appends()
         result = await self._ipc.invoke("fs_read_dir", {"path": path})
         return [_from_dict(FileEntry, e) for e in (result or [])]
     
     async def stat(self, path: str) -> FileStat:
+        await self._sync_appends()
         result = await self._ipc.invoke("fs_stat", {"path": path})
         return _from_dict(FileStat, result)
     
@@ -630,6 +729,7 @@ class RuntimePluginContext(ExtendedPluginContext):
     
     async def shutdown(self) -> None:
         """Shutdown the context"""
+        await self.fs.flush()
         await self._ipc.disconnect()
 
 
@@ -59,7 +59,7 @@ class PluginPermission(Enum):
     PYTHON_EXECUTE = "python:execute"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolParameter:
     """Tool parameter definition"""
     name: str
@@ -70,7 +70,7 @@ class ToolParameter:
     enum: Optional[List[Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolMetadata:
     """Metadata for a tool decorated function"""
     name: str
@@ -80,7 +80,7 @@ class ToolMetadata:
     category: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HookMetadata:
     """Metadata for a hook decorated function"""
     hook_name: str
@@ -88,7 +88,7 @@ class HookMetadata:
     is_async: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandMetadata:
     """Metadata for a command decorated function"""
     name: str
@@ -96,7 +96,7 @@ class CommandMetadata:
     shortcut: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginAuthor:
     """Plugin author information"""
     name: str
@@ -104,7 +104,7 @@ class PluginAuthor:
     url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginManifest:
     """Plugin manifest definition"""
     id: str
@@ -166,7 +166,7 @@ class PluginManifest:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolContext:
     """Context passed to tool execution"""
     session_id: Optional[str] = None
@@ -179,28 +179,39 @@ class ToolContext:
         pass
 
 
-@dataclass
+# logging module level values, so contexts accept logging.INFO etc. without
+# this module importing logging
+_LOG_DEBUG, _LOG_INFO, _LOG_WARN, _LOG_ERROR = 10, 20, 30, 40
+
+
+@dataclass(slots=True)
 class PluginContext:
     """Context provided to plugins"""
     plugin_id: str
     plugin_path: str
     config: Dict[str, Any] = field(default_factory=dict)
+    # Messages below this level are dropped before any formatting
+    log_level: int = _LOG_DEBUG
     
-    def log_debug(self, message: str):
-        """Log debug message"""
-        print(f"[DEBUG][{self.plugin_id}] {message}")
+    def log_debug(self, message: str, *args: Any):
+        """Log debug message, %-formatting ``args`` into it when given"""
+        if self.log_level <= _LOG_DEBUG:
+            print(f"[DEBUG][{self.plugin_id}] {message % args if args else message}")
     
-    def log_info(self, message: str):
-        """Log info message"""
-        print(f"[INFO][{self.plugin_id}] {message}")
+    def log_info(self, message: str, *args: Any):
+        """Log info message, %-formatting ``args`` into it when given"""
+        if self.log_level <= _LOG_INFO:
+            print(f"[INFO][{self.plugin_id}] {message % args if args else message}")
     
-    def log_warn(self, message: str):
-        """Log warning message"""
-        print(f"[WARN][{self.plugin_id}] {message}")
+    def log_warn(self, message: str, *args: Any):
+        """Log warning message, %-formatting ``args`` into it when given"""
+        if self.log_level <= _LOG_WARN:
+            print(f"[WARN][{self.plugin_id}] {message % args if args else message}")
     
-    def log_error(self, message: str):
-        """Log error message"""
-        print(f"[ERROR][{self.plugin_id}] {message}")
+    def log_error(self, message: str, *args: Any):
+        """Log error message, %-formatting ``args`` into it when given"""
+        if self.log_level <= _LOG_ERROR:
+            print(f"[ERROR][{self.plugin_id}] {message % args if args else message}")
 
 
 # Type aliases for hook functions
@@ -220,7 +231,7 @@ class ChatMode(Enum):
     CANVAS = "canvas"
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionFilter:
     """Filter options for listing sessions"""
     project_id: Optional[str] = None
@@ -234,7 +245,7 @@ class SessionFilter:
     sort_order: Optional[str] = None  # 'asc', 'desc'
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageQueryOptions:
     """Options for querying messages"""
     limit: Optional[int] = None
@@ -245,7 +256,7 @@ class MessageQueryOptions:
     before_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageAttachment:
     """Message attachment for plugin use"""
     type: str  # 'file', 'image', 'code', 'url'
@@ -256,7 +267,7 @@ class MessageAttachment:
     size: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SendMessageOptions:
     """Options for sending messages"""
     role: str = "user"  # 'user', 'assistant', 'system'
@@ -265,7 +276,7 @@ class SendMessageOptions:
     skip_processing: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """Session statistics"""
     message_count: int = 0
@@ -277,7 +288,7 @@ class SessionStats:
     attachment_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Chat session"""
     id: str
@@ -289,7 +300,7 @@ class Session:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class UIMessage:
     """UI Message"""
     id: str
@@ -304,7 +315,7 @@ class UIMessage:
 # Project API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ProjectFilter:
     """Filter options for listing projects"""
     is_archived: Optional[bool] = None
@@ -317,7 +328,7 @@ class ProjectFilter:
     sort_order: Optional[str] = None  # 'asc', 'desc'
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeFile:
     """Knowledge file in project"""
     id: str
@@ -329,7 +340,7 @@ class KnowledgeFile:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectFileInput:
     """Project file input for adding to knowledge base"""
     name: str
@@ -338,7 +349,7 @@ class ProjectFileInput:
     mime_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Project definition"""
     id: str
@@ -356,7 +367,7 @@ class Project:
 # Vector/RAG API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class VectorDocument:
     """Vector document for storage"""
     content: str
@@ -365,7 +376,7 @@ class VectorDocument:
     embedding: Optional[List[float]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorFilter:
     """Vector filter for search"""
     key: str
@@ -373,7 +384,7 @@ class VectorFilter:
     operation: str = "eq"  # 'eq', 'ne', 'gt', 'lt', 'gte', 'lte', 'contains', 'in'
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorSearchOptions:
     """Vector search options"""
     top_k: int = 10
@@ -384,7 +395,7 @@ class VectorSearchOptions:
     include_embeddings: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorSearchResult:
     """Vector search result"""
     id: str
@@ -394,7 +405,7 @@ class VectorSearchResult:
     embedding: Optional[List[float]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionOptions:
     """Collection options for vector store"""
     embedding_model: Optional[str] = None
@@ -402,7 +413,7 @@ class CollectionOptions:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionStats:
     """Collection statistics"""
     name: str
@@ -436,7 +447,7 @@ class ColorThemePreset(Enum):
     AMBER = "amber"
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeColors:
     """Theme colors structure"""
     primary: str = ""
@@ -457,7 +468,7 @@ class ThemeColors:
     destructive_foreground: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomTheme:
     """Custom theme definition"""
     id: str
@@ -466,7 +477,7 @@ class CustomTheme:
     is_dark: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeState:
     """Current theme state"""
     mode: ThemeMode
@@ -492,7 +503,7 @@ class ExportFormat(Enum):
     CSV = "csv"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportOptions:
     """Export options"""
     format: ExportFormat
@@ -507,7 +518,7 @@ class ExportOptions:
     include_table_of_contents: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportResult:
     """Export result"""
     success: bool
@@ -520,7 +531,7 @@ class ExportResult:
 # Canvas API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CanvasSelection:
     """Canvas selection"""
     start: int
@@ -528,7 +539,7 @@ class CanvasSelection:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CanvasDocumentVersion:
     """Canvas document version"""
     id: str
@@ -537,7 +548,7 @@ class CanvasDocumentVersion:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CanvasDocument:
     """Canvas document for editing"""
     id: str
@@ -552,7 +563,7 @@ class CanvasDocument:
     versions: List[CanvasDocumentVersion] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateCanvasDocumentOptions:
     """Canvas document creation options"""
     title: str
@@ -566,7 +577,7 @@ class CreateCanvasDocumentOptions:
 # Artifact API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     """Artifact definition"""
     id: str
@@ -580,7 +591,7 @@ class Artifact:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateArtifactOptions:
     """Artifact creation options"""
     title: str
@@ -591,7 +602,7 @@ class CreateArtifactOptions:
     type: str = "code"
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactFilter:
     """Artifact filter options"""
     session_id: Optional[str] = None
@@ -605,7 +616,7 @@ class ArtifactFilter:
 # Notification API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class NotificationAction:
     """Notification action"""
     label: str
@@ -613,7 +624,7 @@ class NotificationAction:
     variant: str = "default"  # 'default', 'primary', 'destructive'
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationOptions:
     """Notification options"""
     title: str
@@ -626,7 +637,7 @@ class NotificationOptions:
     progress: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Notification:
     """Notification instance"""
     id: str
@@ -643,7 +654,7 @@ class Notification:
 # AI Provider API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AIChatMessage:
     """Chat message for AI"""
     role: str  # 'user', 'assistant', 'system'
@@ -651,7 +662,7 @@ class AIChatMessage:
     name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AIChatOptions:
     """Chat options"""
     model: Optional[str] = None
@@ -662,7 +673,7 @@ class AIChatOptions:
     stream: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AIChatChunk:
     """Chat response chunk"""
     content: str
@@ -672,7 +683,7 @@ class AIChatChunk:
     total_tokens: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AIModel:
     """AI model definition"""
     id: str
@@ -720,7 +731,7 @@ class ExtensionPoint(Enum):
     COMMAND_PALETTE = "command-palette"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtensionOptions:
     """Extension options"""
     priority: int = 0
@@ -764,7 +775,7 @@ class ExtendedPermission(Enum):
 # Network API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class NetworkRequestOptions:
     """Network request options"""
     method: str = "GET"
@@ -774,7 +785,7 @@ class NetworkRequestOptions:
     response_type: str = "json"
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkResponse:
     """Network response"""
     ok: bool
@@ -784,7 +795,7 @@ class NetworkResponse:
     data: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadProgress:
     """Download progress"""
     loaded: int
@@ -792,7 +803,7 @@ class DownloadProgress:
     percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadResult:
     """Download result"""
     path: str
@@ -804,7 +815,7 @@ class DownloadResult:
 # File System API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FileEntry:
     """File entry"""
     name: str
@@ -814,7 +825,7 @@ class FileEntry:
     size: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileStat:
     """File statistics"""
     size: int
@@ -827,7 +838,7 @@ class FileStat:
     mode: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileWatchEvent:
     """File watch event"""
     type: str  # 'create', 'modify', 'delete', 'rename'
@@ -839,7 +850,7 @@ class FileWatchEvent:
 # Shell API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ShellOptions:
     """Shell command options"""
     cwd: Optional[str] = None
@@ -848,7 +859,7 @@ class ShellOptions:
     encoding: str = "utf-8"
 
 
-@dataclass
+@dataclass(slots=True)
 class ShellResult:
     """Shell command result"""
     code: int
@@ -861,14 +872,14 @@ class ShellResult:
 # Database API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseResult:
     """Database operation result"""
     rows_affected: int
     last_insert_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TableColumn:
     """Table column definition"""
     name: str
@@ -878,7 +889,7 @@ class TableColumn:
     unique: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TableIndex:
     """Table index definition"""
     name: str
@@ -886,7 +897,7 @@ class TableIndex:
     unique: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TableSchema:
     """Table schema definition"""
     columns: List[TableColumn]
@@ -909,7 +920,7 @@ class ContextMenuContext(Enum):
     CANVAS = "canvas"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextMenuClickContext:
     """Context menu click context"""
     target: ContextMenuContext
@@ -921,7 +932,7 @@ class ContextMenuClickContext:
     position: Optional[Dict[str, int]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextMenuItem:
     """Context menu item"""
     id: str
@@ -938,7 +949,7 @@ class ContextMenuItem:
 # Shortcut API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ShortcutOptions:
     """Shortcut options"""
     when: Optional[str] = None
@@ -946,7 +957,7 @@ class ShortcutOptions:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ShortcutRegistration:
     """Shortcut registration"""
     shortcut: str
@@ -958,7 +969,7 @@ class ShortcutRegistration:
 # Window API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class WindowOptions:
     """Window options"""
     title: str
@@ -983,7 +994,7 @@ class WindowOptions:
 # Upload/Download API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class UploadOptions:
     """Upload options"""
     field_name: str = "file"
@@ -996,7 +1007,7 @@ class UploadOptions:
 # Shell Spawn API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SpawnOptions:
     """Spawn options for long-running processes"""
     cwd: Optional[str] = None
@@ -1004,7 +1015,7 @@ class SpawnOptions:
     stdin: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChildProcess:
     """Child process handle"""
     pid: int
@@ -1025,7 +1036,7 @@ class ChildProcess:
 # Database Transaction API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseTransaction:
     """Database transaction"""
     
@@ -1042,7 +1053,7 @@ class DatabaseTransaction:
 # Export API Extended Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CustomExporter:
     """Custom exporter definition"""
     id: str
@@ -1058,7 +1069,7 @@ class CustomExporter:
 # Artifact Renderer Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactRenderer:
     """Artifact renderer for custom artifact types"""
     type: str
@@ -1119,7 +1130,7 @@ class HookPriority(Enum):
     HIGHEST = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class HookRegistrationOptions:
     """Hook registration options"""
     priority: HookPriority = HookPriority.NORMAL
@@ -1127,7 +1138,7 @@ class HookRegistrationOptions:
     timeout: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HookSandboxExecutionResult:
     """Hook sandbox execution result"""
     success: bool
@@ -1140,7 +1151,7 @@ class HookSandboxExecutionResult:
 # Clipboard API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ClipboardContent:
     """Clipboard content"""
     text: Optional[str] = None
@@ -1161,7 +1172,7 @@ class DebugLogLevel(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugLogEntry:
     """Debug log entry"""
     level: DebugLogLevel
@@ -1172,7 +1183,7 @@ class DebugLogEntry:
     stack: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceEntry:
     """Performance trace entry"""
     name: str
@@ -1183,7 +1194,7 @@ class TraceEntry:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics"""
     plugin_id: str
@@ -1196,7 +1207,7 @@ class PerformanceMetrics:
     traces: List[TraceEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Breakpoint:
     """Debug breakpoint"""
     id: str
@@ -1207,7 +1218,7 @@ class Breakpoint:
     hit_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugSession:
     """Debug session state"""
     id: str
@@ -1219,7 +1230,7 @@ class DebugSession:
     metrics: Optional[PerformanceMetrics] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SlowOperation:
     """Slow operation alert"""
     type: str  # 'tool', 'hook', 'ipc', 'custom'
@@ -1234,7 +1245,7 @@ class SlowOperation:
 # Profiler API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MemoryUsage:
     """Memory usage information"""
     used_heap_size: int
@@ -1243,7 +1254,7 @@ class MemoryUsage:
     external: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceSample:
     """Performance sample with timing data"""
     name: str
@@ -1254,7 +1265,7 @@ class PerformanceSample:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceBucket:
     """Performance bucket for aggregated metrics"""
     name: str
@@ -1268,7 +1279,7 @@ class PerformanceBucket:
     p99: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SlowOperationEntry:
     """Slow operation entry"""
     name: str
@@ -1278,7 +1289,7 @@ class SlowOperationEntry:
     stack: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceReport:
     """Performance report"""
     plugin_id: str
@@ -1290,7 +1301,7 @@ class PerformanceReport:
     slow_operations: List[SlowOperationEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfilerConfig:
     """Profiler configuration"""
     enabled: bool = True
@@ -1305,7 +1316,7 @@ class ProfilerConfig:
 # Version API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SemanticVersion:
     """Semantic version object"""
     major: int
@@ -1315,7 +1326,7 @@ class SemanticVersion:
     build: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateInfo:
     """Update information"""
     current_version: str
@@ -1330,7 +1341,7 @@ class UpdateInfo:
     breaking_changes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionHistoryEntry:
     """Version history entry"""
     version: str
@@ -1340,7 +1351,7 @@ class VersionHistoryEntry:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RollbackOptions:
     """Rollback options"""
     target_version: str
@@ -1348,7 +1359,7 @@ class RollbackOptions:
     keep_data: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateOptions:
     """Update options"""
     silent: bool = False
@@ -1360,7 +1371,7 @@ class UpdateOptions:
 # Dependencies API Types
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DependencySpec:
     """Dependency specification"""
     plugin_id: str
@@ -1368,7 +1379,7 @@ class DependencySpec:
     optional: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedDependency:
     """Resolved dependency"""
     plugin_id: str
@@ -1380,7 +1391,7 @@ class ResolvedDependency:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyNode:
     """Dependency graph node"""
     plugin_id: str
@@ -1390,7 +1401,7 @@ class DependencyNode:
     load_order: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyConflict:
     """Dependency conflict"""
     plugin_id: str
@@ -1398,7 +1409,7 @@ class DependencyConflict:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyCheckResult:
     """Dependency check result"""
     satisfied: bool
@@ -1419,7 +1430,7 @@ class MessagePriority(Enum):
     LOW = "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriptionOptions:
     """Message bus subscription options"""
     priority: MessagePriority = MessagePriority.NORMAL
@@ -1428,7 +1439,7 @@ class SubscriptionOptions:
     timeout: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageMetadata:
     """Published message metadata"""
     id: str
@@ -1439,14 +1450,14 @@ class MessageMetadata:
     correlation_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageEnvelope:
     """Message envelope containing data and metadata"""
     data: Any
     metadata: MessageMetadata
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicStats:
     """Topic statistics"""
     topic: str
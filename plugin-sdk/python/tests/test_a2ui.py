@@ -2,6 +2,7 @@
 Unit tests for cognia.a2ui module
 """
 
+import json
 import pytest
 from cognia.a2ui import (
     A2UIComponentType,
@@ -44,6 +45,17 @@ class TestA2UIComponentType:
         assert A2UIComponentType.CONTAINER.value == "container"
         assert A2UIComponentType.GRID.value == "grid"
         assert A2UIComponentType.TABS.value == "tabs"
+    
+    def test_members_are_wire_strings(self):
+        """Test that members behave as their string values"""
+        import json
+        
+        assert isinstance(A2UIComponentType.TABLE, str)
+        assert A2UIComponentType.TABLE == "table"
+        assert str(A2UIComponentType.BAR_CHART) == "bar-chart"
+        assert f"{A2UIComponentType.BAR_CHART}" == "bar-chart"
+        assert json.dumps({"type": A2UIComponentType.PIE_CHART}) == '{"type": "pie-chart"}'
+        assert A2UIComponentType("table") is A2UIComponentType.TABLE
 
 
 class TestA2UIAction:
@@ -84,6 +96,28 @@ class TestA2UIAction:
         assert action.variant == "destructive"
         assert action.icon == "trash"
         assert action.disabled is False
+    
+    def test_action_to_dict_leaves_fields_unchanged(self):
+        """Test that serializing an action adds nothing to its dataclass view"""
+        import dataclasses
+        from cognia.runtime import _to_dict
+        action = A2UIAction(id="open", label="Open", confirm="Sure?")
+        before = (dataclasses.asdict(action), _to_dict(action))
+        
+        result = action.to_dict()
+        assert result == {
+            "id": "open",
+            "label": "Open",
+            "icon": None,
+            "variant": "default",
+            "disabled": False,
+            "confirm": "Sure?",
+        }
+        assert (dataclasses.asdict(action), _to_dict(action)) == before
+        assert "_dict" not in before[0]
+        
+        action.disabled = True
+        assert action.to_dict()["disabled"] is True
 
 
 class TestA2UIDataBinding:
@@ -156,6 +190,15 @@ class TestA2UIStyle:
         assert result["margin"] == "8px"
         assert result["borderRadius"] == "4px"
         assert result["shadow"] == "md"
+    
+    def test_style_drops_unset_custom_entries(self):
+        """Test that None custom values are left out of the serialized style"""
+        style = A2UIStyle(width="10px", custom={"gap": "8px", "color": None})
+        
+        assert style.to_dict() == {"width": "10px", "gap": "8px"}
+        
+        style.custom["gap"] = None
+        assert style.to_dict() == {"width": "10px"}
 
 
 class TestA2UIVariable:
@@ -416,6 +459,29 @@ class TestA2UIBuilder:
         assert result["name"] == "sales-chart"
         assert result["props"]["showLegend"] == True
         assert len(result["actions"]) == 2
+    
+    def test_build_dict_matches_build(self):
+        """Test that build_dict() serializes the same as build().to_dict()"""
+        child = A2UIBuilder().type("text").name("t1").build()
+        builder = (
+            A2UIBuilder()
+            .type(A2UIComponentType.CARD)
+            .name("card")
+            .description("A card")
+            .icon("square")
+            .props_schema({"type": "object"})
+            .props({"title": "Hi"})
+            .action("open", "Open", variant="primary")
+            .style(padding="8px", gap="4px")
+            .child(child)
+        )
+        
+        assert builder.build_dict() == builder.build().to_dict()
+        assert A2UIBuilder().build_dict() == A2UIBuilder().build().to_dict()
+    
+    def test_builder_has_no_instance_dict(self):
+        """Test that the builder uses slots"""
+        assert not hasattr(A2UIBuilder(), "__dict__")
 
 
 class TestA2UIDecorators:
@@ -458,6 +524,17 @@ class TestA2UIDecorators:
         metadata = render_data_grid._a2ui_template
         assert metadata.id == "data-grid"
         assert len(metadata.variables) == 2
+    
+    def test_decorators_return_original_function(self):
+        """Test that uncached decorators add no wrapper"""
+        def render_panel(self):
+            return {}
+        
+        def render_view(self, variables):
+            return []
+        
+        assert a2ui_component("panel", "Panel")(render_panel) is render_panel
+        assert a2ui_template("view", "View", "V")(render_view) is render_view
 
 
 class TestComponentHelper:
@@ -528,3 +605,294 @@ class TestA2UIEvents:
         assert event.action_id == "submit"
         assert event.component_id == "form-submit"
         assert event.payload["form_data"]["name"] == "Test"
+    
+    def test_action_event_default_data_serializes(self):
+        """Test that events without data can be sent as JSON"""
+        import dataclasses
+        
+        first = A2UIActionEvent(component_id="form", action_id="reset")
+        second = A2UIActionEvent(component_id="form", action_id="cancel")
+        
+        assert first.data == {}
+        assert first.data is not second.data
+        assert json.loads(json.dumps(dataclasses.asdict(first))) == {
+            "component_id": "form",
+            "action_id": "reset",
+            "data": {},
+        }
+
+
+class TestA2UISerialization:
+    """Tests for A2UIComponentDef/A2UITemplateDef serialization output"""
+    
+    def _full_component(self):
+        leaf = A2UIComponentDef(type="text", name="caption", default_props={"text": "hi"})
+        return A2UIComponentDef(
+            type="card",
+            name="summary",
+            description="Summary card",
+            category="display",
+            icon="info",
+            props_schema={"type": "object"},
+            default_props={"title": "Summary"},
+            actions=[A2UIAction(id="open", label="Open", variant="primary")],
+            style=A2UIStyle(
+                width="100%",
+                border_radius="4px",
+                class_name="card",
+                custom={"gap": "8px", "color": None},
+            ),
+            children=[leaf],
+        )
+    
+    def test_full_component_to_dict(self):
+        """Test that every populated field is emitted with its JSON key"""
+        assert self._full_component().to_dict() == {
+            "type": "card",
+            "name": "summary",
+            "description": "Summary card",
+            "category": "display",
+            "icon": "info",
+            "propsSchema": {"type": "object"},
+            "defaultProps": {"title": "Summary"},
+            "actions": [
+                {
+                    "id": "open",
+                    "label": "Open",
+                    "icon": None,
+                    "variant": "primary",
+                    "disabled": False,
+                    "confirm": None,
+                },
+            ],
+            "style": {"width": "100%", "borderRadius": "4px", "className": "card", "gap": "8px"},
+            "children": [{"type": "text", "name": "caption", "defaultProps": {"text": "hi"}}],
+        }
+    
+    def test_leaf_component_to_dict(self):
+        """Test that unset optional fields are omitted"""
+        assert A2UIComponentDef(type="divider", name="sep").to_dict() == {
+            "type": "divider",
+            "name": "sep",
+        }
+    
+    def test_nested_children_keep_order(self):
+        """Test that nested children serialize in order, children key last"""
+        leaf = lambda n: A2UIComponentDef(type="text", name=n)
+        tree = A2UIComponentDef(
+            type="container",
+            name="root",
+            icon="box",
+            children=[
+                A2UIComponentDef(type="card", name="a", children=[leaf("a1"), leaf("a2")]),
+                leaf("b"),
+            ],
+        )
+        
+        result = tree.to_dict()
+        assert list(result) == ["type", "name", "icon", "children"]
+        assert [c["name"] for c in result["children"]] == ["a", "b"]
+        assert [c["name"] for c in result["children"][0]["children"]] == ["a1", "a2"]
+        assert "children" not in result["children"][1]
+    
+    def test_deep_tree_does_not_hit_recursion_limit(self):
+        """Test serializing a tree deeper than the recursion limit"""
+        import sys
+        
+        node = A2UIComponentDef(type="text", name="leaf")
+        for i in range(sys.getrecursionlimit() + 100):
+            node = A2UIComponentDef(type="container", name=f"n{i}", children=[node])
+        
+        result = node.to_dict()
+        while "children" in result:
+            result = result["children"][0]
+        assert result == {"type": "text", "name": "leaf"}
+    
+    def test_component_to_json_bytes(self):
+        """Test JSON bytes serialization matches to_dict"""
+        import json
+        
+        comp = self._full_component()
+        assert json.loads(comp.to_json_bytes()) == comp.to_dict()
+    
+    def test_template_to_json_bytes(self):
+        """Test template JSON bytes serialization matches to_dict"""
+        import json
+        
+        template = A2UITemplateDef(
+            id="tpl",
+            name="Template",
+            description="A template",
+            components=[self._full_component()],
+            variables=[A2UIVariable(name="title", type="string", required=True)],
+            tags=["demo"],
+        )
+        assert json.loads(template.to_json_bytes()) == template.to_dict()
+
+
+class TestA2UIDataclassLayout:
+    """Tests for slotted/frozen A2UI dataclasses"""
+    
+    def test_component_def_has_no_instance_dict(self):
+        """Test that slotted dataclasses don't allocate a __dict__"""
+        comp = A2UIComponentDef(type="text", name="t")
+        assert not hasattr(comp, "__dict__")
+        assert not hasattr(A2UIStyle(), "__dict__")
+    
+    def test_events_are_frozen(self):
+        """Test that event dataclasses are immutable"""
+        import dataclasses
+        
+        change = A2UIDataChange(
+            component_id="c1", path="value", old_value=1, new_value=2, source="user"
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            change.new_value = 3
+        event = A2UIActionEvent(component_id="form", action_id="submit")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.data = {"x": 1}
+        assert change != ("c1", "value", 1, 2, "user")
+        assert dataclasses.asdict(change) == {
+            "component_id": "c1",
+            "path": "value",
+            "old_value": 1,
+            "new_value": 2,
+            "source": "user",
+        }
+
+
+class TestComponentTypeResolution:
+    """Tests for resolving component types to wire strings"""
+    
+    def test_component_helper_accepts_enum_and_string(self):
+        """Test that component() emits the same type for enum and string"""
+        assert component(A2UIComponentType.BAR_CHART) == {"type": "bar-chart"}
+        assert component("bar-chart", {"data": []}) == {"type": "bar-chart", "props": {"data": []}}
+    
+    def test_component_helper_with_extra_properties(self):
+        """Test that extra properties follow type/props and can override them"""
+        result = component("card", {"title": "T"}, id="c1", children=[])
+        
+        assert list(result) == ["type", "props", "id", "children"]
+        assert component("card", {}, type="panel") == {"type": "panel"}
+    
+    def test_builder_type_accepts_enum_and_string(self):
+        """Test that the builder resolves enum members to their value"""
+        from_enum = A2UIBuilder().type(A2UIComponentType.TABLE).name("t").build()
+        from_str = A2UIBuilder().type("my-widget").name("w").build()
+        
+        assert from_enum.to_dict()["type"] == "table"
+        assert from_str.to_dict()["type"] == "my-widget"
+
+
+class TestTemplateCache:
+    """Tests for memoized template providers"""
+    
+    def test_cache_disabled_by_default(self):
+        """Test that template providers run on every call by default"""
+        calls = []
+        
+        @a2ui_template("uncached-tpl", "Uncached", "No cache")
+        def render(rows):
+            calls.append(rows)
+            return {"rows": rows}
+        
+        render(1)
+        render(1)
+        assert len(calls) == 2
+    
+    def test_cache_hits_and_eviction(self):
+        """Test that cached results are reused and the oldest is evicted"""
+        calls = []
+        
+        @a2ui_template("cached-tpl", "Cached", "With cache", cache_size=2)
+        def render(data, title=None):
+            calls.append((title, data))
+            return {"title": title, "data": data}
+        
+        first = render({"a": [1, 2]}, title="x")
+        assert render({"a": [1, 2]}, title="x") is first
+        render([1], title="y")
+        render([2], title="z")
+        render({"a": [1, 2]}, title="x")
+        
+        assert len(calls) == 4
+        assert render._a2ui_template["id"] == "cached-tpl"
+    
+    def test_unhashable_arguments_bypass_cache(self):
+        """Test that unhashable arguments are passed through uncached"""
+        calls = []
+        
+        @a2ui_template("unhashable-tpl", "Unhashable", "Bypass", cache_size=4)
+        def render(value):
+            calls.append(value)
+            return {"value": value}
+        
+        class Unhashable:
+            __hash__ = None
+        
+        arg = Unhashable()
+        render(arg)
+        render(arg)
+        assert len(calls) == 2
+    
+    def test_invalidate_template(self):
+        """Test dropping cached results for a template"""
+        from cognia.a2ui import invalidate_template
+        calls = []
+        
+        @a2ui_template("invalidated-tpl", "Invalidated", "Invalidate", cache_size=4)
+        def render(value):
+            calls.append(value)
+            return {"value": value}
+        
+        render(1)
+        invalidate_template(render)
+        render(1)
+        assert len(calls) == 2
+        
+        # Providers without a cache are accepted and left alone
+        invalidate_template(lambda: None)
+    
+    def test_equal_values_of_different_types_are_distinct(self):
+        """Test that 1, 1.0 and True are cached separately"""
+        @a2ui_template("typed-tpl", "Typed", "Typed keys", cache_size=8)
+        def render(value):
+            return {"value": value, "type": type(value).__name__}
+        
+        assert render(1)["type"] == "int"
+        assert render(True)["type"] == "bool"
+        assert render(1.0)["type"] == "float"
+        assert render({"k": 1})["value"] == {"k": 1}
+        assert render({"k": True})["value"] == {"k": True}
+    
+    def test_caches_are_per_provider_and_skip_self(self):
+        """Test that same-id providers don't share caches and instances aren't retained"""
+        import gc
+        import weakref
+        from cognia.a2ui import invalidate_template
+        
+        class First:
+            @a2ui_template("shared-tpl", "First", "First", cache_size=4)
+            def render(self, value):
+                return {"from": "first", "value": value}
+        
+        class Second:
+            @a2ui_template("shared-tpl", "Second", "Second", cache_size=4)
+            def render(self, value):
+                return {"from": "second", "value": value}
+        
+        first = First()
+        assert first.render(1)["from"] == "first"
+        assert Second().render(1)["from"] == "second"
+        
+        # Another instance reuses the cached result
+        assert First().render(1) is first.render(1)
+        
+        invalidate_template(Second().render)
+        assert First().render(1) is first.render(1)
+        
+        ref = weakref.ref(first)
+        del first
+        gc.collect()
+        assert ref() is None
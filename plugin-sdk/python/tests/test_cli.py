@@ -113,6 +113,16 @@ class TestCreatePlugin:
         
         assert manifest["description"] == "A plugin with description"
     
+    def test_create_plugin_keeps_non_ascii_manifest_text(self, temp_dir):
+        """Test that non-ASCII manifest text is written as UTF-8, not escaped"""
+        plugin_path = os.path.join(temp_dir, "intl-plugin")
+        
+        create_plugin("Intl Plugin", path=plugin_path, description="Météo für 東京")
+        
+        raw = Path(plugin_path, "plugin.json").read_text(encoding="utf-8")
+        assert "Météo für 東京" in raw
+        assert json.loads(raw)["description"] == "Météo für 東京"
+    
     def test_create_plugin_main_py(self, temp_dir):
         """Test main.py content"""
         plugin_path = os.path.join(temp_dir, "test-plugin")
@@ -188,6 +198,33 @@ class TestPlugin(Plugin):
         yield temp
         shutil.rmtree(temp, ignore_errors=True)
     
+    def test_generate_manifest_from_class(self, temp_plugin):
+        """Test generating plugin.json from the plugin class"""
+        generate_manifest(path=temp_plugin)
+        
+        with open(os.path.join(temp_plugin, "plugin.json")) as f:
+            manifest = json.load(f)
+        assert manifest["id"] == "test-plugin"
+        assert manifest["capabilities"] == ["tools"]
+        assert [t["name"] for t in manifest["tools"]] == ["test_tool"]
+        
+        # The generated manifest passes validation
+        generate_manifest(path=temp_plugin, validate_only=True)
+    
+    def test_generate_manifest_prefers_plugin_export(self, temp_plugin):
+        """Test that __plugin__ selects the class when several are defined"""
+        with open(os.path.join(temp_plugin, "main.py"), "a") as f:
+            f.write(
+                "\n\nclass AAAPlugin(Plugin):\n"
+                "    name = 'other-plugin'\n"
+                "\n__plugin__ = TestPlugin\n"
+            )
+        
+        generate_manifest(path=temp_plugin)
+        
+        with open(os.path.join(temp_plugin, "plugin.json")) as f:
+            assert json.load(f)["id"] == "test-plugin"
+    
     def test_validate_valid_manifest(self, temp_plugin):
         """Test validating a valid manifest"""
         manifest = {
@@ -227,6 +264,26 @@ class TestPlugin(Plugin):
         with pytest.raises(SystemExit):
             generate_manifest(path=temp_plugin, validate_only=True)
     
+    def test_validate_invalid_json_without_orjson(self, temp_plugin):
+        """Test that the stdlib json fallback reports invalid JSON too"""
+        from cognia import cli
+        
+        with open(os.path.join(temp_plugin, "plugin.json"), "w") as f:
+            f.write("{ invalid json }")
+        
+        with patch.object(cli, "orjson", None):
+            with pytest.raises(SystemExit):
+                generate_manifest(path=temp_plugin, validate_only=True)
+    
+    def test_validate_reports_missing_fields_in_order(self, temp_plugin, capsys):
+        """Test that missing fields are listed in a stable order"""
+        with open(os.path.join(temp_plugin, "plugin.json"), "w") as f:
+            json.dump({"name": "Test", "type": "python"}, f)
+        
+        with pytest.raises(SystemExit):
+            generate_manifest(path=temp_plugin, validate_only=True)
+        assert "Missing required fields: id, version, description" in capsys.readouterr().out
+    
     def test_validate_no_manifest(self, temp_plugin):
         """Test validating when no manifest exists"""
         with pytest.raises(SystemExit):
@@ -333,6 +390,58 @@ class TestPackPlugin:
         
         assert os.path.exists(custom_output)
     
+    def test_pack_custom_output_not_packed_into_itself(self, temp_plugin):
+        """Test that an output path inside the plugin is not archived"""
+        import zipfile
+        
+        custom_output = os.path.join(temp_plugin, "out.zip")
+        pack_plugin(path=temp_plugin, output=custom_output)
+        
+        with zipfile.ZipFile(custom_output, 'r') as zf:
+            assert "out.zip" not in zf.namelist()
+    
+    def test_pack_prunes_nested_excluded_dirs(self, temp_plugin):
+        """Test pack skips excluded directories and suffixes at any depth"""
+        import zipfile
+        
+        for rel in (
+            os.path.join(".venv", "lib", "site.py"),
+            os.path.join("pkg", "demo.egg-info", "PKG-INFO"),
+            os.path.join("pkg", "build", "out.py"),
+            os.path.join("pkg", "util.pyc"),
+            os.path.join("pkg", "util.py"),
+        ):
+            full = os.path.join(temp_plugin, rel)
+            os.makedirs(os.path.dirname(full), exist_ok=True)
+            with open(full, "w") as f:
+                f.write("x")
+        
+        pack_plugin(path=temp_plugin)
+        
+        zip_path = list(Path(temp_plugin, "dist").glob("*.zip"))[0]
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            names = zf.namelist()
+        assert "pkg/util.py" in names
+        assert not any(
+            n.startswith(".venv/") or "egg-info" in n or "/build/" in n or n.endswith(".pyc")
+            for n in names
+        )
+    
+    def test_pack_stores_precompressed_files(self, temp_plugin):
+        """Test that already-compressed files are stored, sources deflated"""
+        import zipfile
+        
+        with open(os.path.join(temp_plugin, "icon.png"), "wb") as f:
+            f.write(b"\x89PNG" + bytes(range(256)))
+        
+        pack_plugin(path=temp_plugin, compresslevel=1)
+        
+        zip_path = list(Path(temp_plugin, "dist").glob("*.zip"))[0]
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            assert zf.getinfo("icon.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("main.py").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read("icon.png").startswith(b"\x89PNG")
+    
     def test_pack_no_manifest(self):
         """Test pack fails without manifest"""
         temp = tempfile.mkdtemp()
@@ -382,6 +491,40 @@ def test_example():
         yield temp
         shutil.rmtree(temp, ignore_errors=True)
     
+    def test_run_tests_in_process(self, temp_plugin):
+        """Test that tests run via pytest.main from the plugin directory"""
+        seen = {}
+        
+        def fake_main(args):
+            seen["args"] = args
+            seen["cwd"] = os.getcwd()
+            seen["path"] = sys.path[0]
+            return 0
+        
+        cwd = os.getcwd()
+        with patch.object(pytest, "main", fake_main), patch("subprocess.run") as run:
+            with pytest.raises(SystemExit) as exc_info:
+                run_tests(path=temp_plugin, verbose=True)
+        
+        assert exc_info.value.code == 0
+        run.assert_not_called()
+        assert seen["args"] == [os.path.join(temp_plugin, "tests"), "-v"]
+        assert os.path.samefile(seen["cwd"], temp_plugin)
+        assert seen["path"] == temp_plugin
+        assert os.getcwd() == cwd
+        assert temp_plugin not in sys.path
+    
+    def test_run_tests_isolated_uses_subprocess(self, temp_plugin):
+        """Test that isolated runs spawn a separate interpreter"""
+        with patch("subprocess.run", return_value=Mock(returncode=3)) as run:
+            with pytest.raises(SystemExit) as exc_info:
+                run_tests(path=temp_plugin, isolated=True)
+        
+        assert exc_info.value.code == 3
+        cmd = run.call_args[0][0]
+        assert cmd[1:] == ["-m", "pytest", os.path.join(temp_plugin, "tests")]
+        assert run.call_args[1]["cwd"] == temp_plugin
+    
     def test_run_tests_no_tests_dir(self):
         """Test error when no tests directory"""
         temp = tempfile.mkdtemp()
@@ -428,6 +571,63 @@ class TestDevServer:
 
         assert any(change.endswith("main.py") for change in changes)
 
+    def test_start_dev_server_uses_watchfiles_events(self, temp_plugin):
+        """Unbounded sessions should consume watchfiles events when available."""
+        import types
+        changes = []
+        seen_filters = []
+
+        def fake_watch(path, watch_filter):
+            seen_filters.append(watch_filter)
+            yield {(2, os.path.join(temp_plugin, "main.py"))}
+            raise KeyboardInterrupt
+
+        fake_module = types.SimpleNamespace(watch=fake_watch)
+        with patch.dict(sys.modules, {"watchfiles": fake_module}):
+            snapshot = start_dev_server(path=temp_plugin, on_change=changes.append)
+
+        assert changes == ["main.py"]
+        assert any(path.endswith("main.py") for path in snapshot)
+        watch_filter = seen_filters[0]
+        assert watch_filter(1, os.path.join(temp_plugin, "plugin.json"))
+        assert not watch_filter(1, os.path.join(temp_plugin, "__pycache__", "main.py"))
+        assert not watch_filter(1, os.path.join(temp_plugin, "notes.txt"))
+
+    def test_start_dev_server_relative_path_under_ignored_dir(self, tmp_path, monkeypatch):
+        """A relative plugin path inside e.g. dist/ should still see its own changes."""
+        import types
+        plugin_dir = tmp_path / "dist" / "plugin"
+        plugin_dir.mkdir(parents=True)
+        (plugin_dir / "main.py").write_text("print('hello')\n")
+        monkeypatch.chdir(tmp_path / "dist")
+        changes = []
+        seen_filters = []
+
+        def fake_watch(path, watch_filter):
+            seen_filters.append(watch_filter)
+            yield {(2, str(plugin_dir / "main.py"))}
+            raise KeyboardInterrupt
+
+        fake_module = types.SimpleNamespace(watch=fake_watch)
+        with patch.dict(sys.modules, {"watchfiles": fake_module}):
+            start_dev_server(path="plugin", on_change=changes.append)
+
+        assert changes == ["main.py"]
+        assert seen_filters[0](2, str(plugin_dir / "main.py"))
+
+        # Polling reports the same relative paths
+        snapshot = start_dev_server(path="plugin", poll_interval=0.01, max_cycles=1)
+        (plugin_dir / "main.py").write_text("# changed\n")
+        polled = []
+        start_dev_server(
+            path="plugin",
+            poll_interval=0.01,
+            max_cycles=1,
+            on_change=polled.append,
+            initial_snapshot={k: v - 1 for k, v in snapshot.items()},
+        )
+        assert polled == ["main.py"]
+
     def test_create_dev_reload_event(self):
         """Dev reload events should be structured for host consumption."""
         event = create_dev_reload_event("dev-plugin", "main.py", ok=True)
@@ -457,6 +657,14 @@ class TestCLIMain:
             captured = capsys.readouterr()
             assert "v1.0.0" in captured.out
     
+    def test_main_version_skips_parser(self, capsys):
+        """Test that plain `cognia version` doesn't build the argument parser"""
+        with patch('sys.argv', ['cognia', 'version']):
+            with patch('argparse.ArgumentParser') as mock_parser:
+                main()
+                mock_parser.assert_not_called()
+        assert "Cognia Plugin SDK v" in capsys.readouterr().out
+    
     def test_main_new_command(self):
         """Test new command parsing"""
         temp = tempfile.mkdtemp()
@@ -2,8 +2,9 @@
 Unit tests for cognia.context module
 """
 
+import asyncio
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 from typing import Dict, Any, List
 
 from cognia.context import (
@@ -53,6 +54,40 @@ from cognia.types import (
 )
 
 
+class TestAPIBaseClasses:
+    """Tests for the abstract API base classes"""
+    
+    def test_slotted_implementation_has_no_instance_dict(self):
+        """Test that a slotted implementation of an API carries no __dict__"""
+        class SlottedStorage(StorageAPI):
+            __slots__ = ("_data",)
+            
+            def __init__(self):
+                self._data = {}
+            
+            async def get(self, key):
+                return self._data.get(key)
+            
+            async def set(self, key, value):
+                self._data[key] = value
+            
+            async def delete(self, key):
+                self._data.pop(key, None)
+            
+            async def keys(self):
+                return list(self._data)
+            
+            async def clear(self):
+                self._data.clear()
+        
+        assert not hasattr(SlottedStorage(), "__dict__")
+    
+    def test_api_classes_declare_empty_slots(self):
+        """Test that every API base class declares empty __slots__"""
+        for api in (SessionAPI, ProjectAPI, VectorAPI, ThemeAPI, StorageAPI, I18nAPI):
+            assert api.__dict__["__slots__"] == ()
+
+
 class TestExtendedPluginContext:
     """Tests for ExtendedPluginContext"""
     
@@ -105,6 +140,15 @@ class TestExtendedPluginContext:
         ctx.log_error("Error message")
         captured = capsys.readouterr()
         assert "[ERROR][test]" in captured.out
+    
+    def test_log_level(self, capsys):
+        """Test that log_level suppresses lower-level messages"""
+        ctx = ExtendedPluginContext(plugin_id="test", plugin_path="/test", log_level=40)
+        ctx.log_warn("Warning message")
+        ctx.log_error("Error message")
+        captured = capsys.readouterr()
+        assert "[WARN]" not in captured.out
+        assert "[ERROR][test] Error message" in captured.out
 
 
 class TestProgressNotification:
@@ -148,6 +192,74 @@ class TestProgressNotification:
         assert call_args[1]["type"] == "error"
         assert call_args[1]["message"] == "Something went wrong"
 
+    
+    @pytest.mark.asyncio
+    async def test_rapid_updates_are_coalesced(self, mock_notifications_api):
+        """Test that updates inside min_interval collapse into one trailing update"""
+        progress = ProgressNotification(id="notif-123", api=mock_notifications_api, min_interval=0.02)
+        progress.update(0.0, "Starting")
+        for i in range(1, 100):
+            progress.update(i / 100)
+        assert mock_notifications_api.update.call_count == 1
+        
+        await asyncio.sleep(0.05)
+        
+        assert mock_notifications_api.update.call_count == 2
+        assert mock_notifications_api.update.call_args[1] == {"progress": 0.99}
+    
+    @pytest.mark.asyncio
+    async def test_final_update_is_sent_immediately(self, mock_notifications_api):
+        """Test that reaching 100% is not held back by the interval"""
+        progress = ProgressNotification(id="notif-123", api=mock_notifications_api, min_interval=10)
+        progress.update(0.1)
+        progress.update(0.5, "Almost")
+        progress.update(1.0)
+        
+        assert mock_notifications_api.update.call_count == 2
+        assert mock_notifications_api.update.call_args[1] == {"progress": 1.0, "message": "Almost"}
+        assert progress._timer is None
+    
+    @pytest.mark.asyncio
+    async def test_flush_sends_held_back_update(self, mock_notifications_api):
+        """Test that flush() delivers a pending update without waiting for the timer"""
+        progress = ProgressNotification(id="notif-123", api=mock_notifications_api, min_interval=10)
+        progress.update(0.1)
+        progress.update(0.4)
+        progress.flush()
+        
+        assert mock_notifications_api.update.call_args[1] == {"progress": 0.4}
+        assert progress._timer is None
+    
+    @pytest.mark.asyncio
+    async def test_coalesced_update_keeps_message(self, mock_notifications_api):
+        """Test that a message from a skipped update is not lost"""
+        progress = ProgressNotification(id="notif-123", api=mock_notifications_api, min_interval=10)
+        progress.update(0.1)
+        progress.update(0.2, "Phase two")
+        progress.update(0.3)
+        progress.flush()
+        
+        assert mock_notifications_api.update.call_args[1] == {"progress": 0.3, "message": "Phase two"}
+    
+    @pytest.mark.asyncio
+    async def test_complete_supersedes_pending_update(self, mock_notifications_api):
+        """Test that complete sends immediately and drops a waiting update"""
+        progress = ProgressNotification(id="notif-123", api=mock_notifications_api, min_interval=0.02)
+        progress.update(0.1)
+        progress.update(0.5)
+        progress.complete("Done!")
+        await asyncio.sleep(0.05)
+        
+        progresses = [c[1].get("progress") for c in mock_notifications_api.update.call_args_list]
+        assert progresses == [0.1, 1.0]
+    
+    def test_updates_without_event_loop_are_sent(self, mock_notifications_api):
+        """Test that updates outside an event loop are never held back"""
+        progress = ProgressNotification(id="notif-123", api=mock_notifications_api, min_interval=10)
+        progress.update(0.1)
+        progress.update(0.2)
+        
+        assert mock_notifications_api.update.call_count == 2
 
 class TestDialogOptions:
     """Tests for DialogOptions"""
@@ -474,6 +586,94 @@ class TestNotificationCenterAPIUsage:
         assert progress.id == "notification-id"
 
 
+class TestAIProviderEmbedArray:
+    """Tests for AIProviderAPI.embed_array"""
+    
+    @pytest.fixture
+    def provider(self):
+        """Create a provider whose embed returns [len(text), index] rows"""
+        calls = []
+        
+        class Provider(AIProviderAPI):
+            async def embed(self, texts):
+                calls.append(list(texts))
+                return [[float(len(text)), float(i)] for i, text in enumerate(texts)]
+        
+        with patch.object(Provider, "__abstractmethods__", frozenset()):
+            instance = Provider()
+        instance.calls = calls
+        return instance
+    
+    @pytest.mark.asyncio
+    async def test_embed_array_batches(self, provider):
+        """Test that texts are embedded in batches into one float32 array"""
+        np = pytest.importorskip("numpy")
+        
+        result = await provider.embed_array(["a", "bb", "ccc"], batch_size=2)
+        
+        assert provider.calls == [["a", "bb"], ["ccc"]]
+        assert result.dtype == np.float32
+        assert result.tolist() == [[1.0, 0.0], [2.0, 1.0], [3.0, 0.0]]
+    
+    @pytest.mark.asyncio
+    async def test_embed_array_rejects_short_batches(self, provider):
+        """Test that a batch with the wrong number of vectors raises ValueError"""
+        pytest.importorskip("numpy")
+        
+        async def embed_nothing(texts):
+            return []
+        
+        provider.embed = embed_nothing
+        with pytest.raises(ValueError, match="0 vectors for 2 texts"):
+            await provider.embed_array(["a", "bb"])
+        
+        async def embed_one(texts):
+            return [[1.0, 2.0]]
+        
+        provider.embed = embed_one
+        with pytest.raises(ValueError, match="1 vectors for 2 texts"):
+            await provider.embed_array(["a", "bb"])
+    
+    @pytest.mark.asyncio
+    async def test_embed_array_rejects_empty_batches(self, provider):
+        """Test that a batch_size below one is rejected"""
+        with pytest.raises(ValueError):
+            await provider.embed_array(["a"], batch_size=0)
+
+class TestPermissionAPIDefaults:
+    """Tests for PermissionAPI's set-based permission checks"""
+    
+    @pytest.fixture
+    def permissions(self):
+        """Create a permission API granting two permissions"""
+        class Permissions(PermissionAPI):
+            def has_permission(self, permission):
+                return permission in self.get_granted_permissions()
+            
+            async def request_permission(self, permission, reason=None):
+                return False
+            
+            def get_granted_permissions(self):
+                return [ExtendedPermission.SESSION_READ, ExtendedPermission.AI_CHAT]
+        
+        return Permissions()
+    
+    def test_has_all_permissions(self, permissions):
+        """Test that every requested permission must be granted"""
+        assert permissions.has_all_permissions([ExtendedPermission.SESSION_READ])
+        assert permissions.has_all_permissions([])
+        assert not permissions.has_all_permissions([
+            ExtendedPermission.SESSION_READ, ExtendedPermission.THEME_WRITE,
+        ])
+    
+    def test_has_any_permission(self, permissions):
+        """Test that one granted permission is enough"""
+        assert permissions.has_any_permission([
+            ExtendedPermission.THEME_WRITE, ExtendedPermission.AI_CHAT,
+        ])
+        assert not permissions.has_any_permission([ExtendedPermission.THEME_WRITE])
+        assert not permissions.has_any_permission([])
+
 class TestIntegrationPatterns:
     """Tests for common integration patterns"""
     
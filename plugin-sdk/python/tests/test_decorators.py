@@ -132,6 +132,17 @@ class TestToolDecorator:
             assert result == "HELLO"
         
         asyncio.run(test())
+    
+    def test_bare_tool(self):
+        """Test tool applied without parentheses"""
+        @tool
+        def ping(self, host: str) -> str:
+            """Ping a host."""
+            return host
+        
+        assert ping._tool_metadata["name"] == "ping"
+        assert ping._tool_metadata["description"] == "Ping a host."
+        assert ping._tool_metadata["parameters"]["host"]["type"] == "string"
 
 
 class TestHookDecorator:
@@ -242,7 +253,46 @@ class TestCommandDecorator:
         
         result = echo(MockSelf(), ["hello", "world"])
         assert result == "hello world"
+    
+    def test_bare_command(self):
+        """Test command applied without parentheses"""
+        @command
+        def reload(self, args: List[str]):
+            pass
+        
+        assert reload._command_metadata["name"] == "reload"
+        assert reload._command_metadata["shortcut"] is None
+
 
+class TestDecoratorsReturnOriginal:
+    """Tests that decorators attach metadata without wrapping"""
+    
+    def test_decorators_return_original_function(self):
+        """Test that each decorator returns the function it was given"""
+        from cognia.decorators import scheduled
+        
+        def func(self):
+            pass
+        
+        assert tool()(func) is func
+        assert hook("on_load")(func) is func
+        assert command()(func) is func
+        assert scheduled(interval=60)(func) is func
+        assert func._tool_metadata["name"] == "func"
+        assert func._hook_metadata["hook_name"] == "on_load"
+    
+    def test_async_functions_stay_coroutine_functions(self):
+        """Test that decorated coroutines are still detected as async"""
+        @hook("on_agent_step")
+        async def on_step(self, agent_id: str):
+            pass
+        
+        @tool(description="async tool")
+        async def fetch(self, url: str):
+            pass
+        
+        assert asyncio.iscoroutinefunction(on_step)
+        assert asyncio.iscoroutinefunction(fetch)
 
 class TestPythonTypeToJsonType:
     """Tests for _python_type_to_json_type helper"""
@@ -251,6 +301,15 @@ class TestPythonTypeToJsonType:
         """Test string type conversion"""
         assert _python_type_to_json_type(str) == 'string'
     
+    def test_other_classes_fall_back_to_name(self):
+        """Test that classes outside the built-in table map by name"""
+        class str_like(str):
+            pass
+        
+        assert _python_type_to_json_type(str_like) == 'string'
+        assert _python_type_to_json_type(type(None)) == 'string'
+        assert _python_type_to_json_type(Any) == 'any'
+    
     def test_int_type(self):
         """Test int type conversion"""
         assert _python_type_to_json_type(int) == 'number'
@@ -486,6 +545,43 @@ class TestValidHooks:
         """Test number of valid hooks"""
         assert len(VALID_HOOKS) == len(HookType)
         assert len(VALID_HOOKS) >= 50  # We have 50+ hooks
+    
+    def test_hook_type_is_str(self):
+        """Test HookType members are usable directly as hook name strings"""
+        assert HookType.ON_AGENT_STEP == "on_agent_step"
+        assert str(HookType.ON_AGENT_STEP) == "on_agent_step"
+        assert f"{HookType.ON_AGENT_STEP}" == "on_agent_step"
+        assert HookType.ON_AGENT_STEP in VALID_HOOKS
+    
+    def test_enum_hook_name_stored_as_plain_str(self):
+        """Test enum hook names are stored as plain strings in metadata"""
+        @hook(HookType.ON_LOAD)
+        def on_load():
+            pass
+        
+        assert type(on_load._hook_metadata["hook_name"]) is str
+    
+    def test_is_frozenset(self):
+        """Test VALID_HOOKS cannot be mutated"""
+        assert isinstance(VALID_HOOKS, frozenset)
+    
+    def test_string_and_enum_hooks_normalize_alike(self):
+        """Test hook names given as enum or string produce the same metadata"""
+        @hook(HookType.ON_AGENT_STEP)
+        def by_enum():
+            pass
+        
+        @hook("on_agent_step")
+        def by_string():
+            pass
+        
+        @hook("custom_hook")
+        def custom():
+            pass
+        
+        assert by_enum._hook_metadata["hook_name"] == "on_agent_step"
+        assert by_string._hook_metadata["hook_name"] == "on_agent_step"
+        assert custom._hook_metadata["hook_name"] == "custom_hook"
 
 
 class TestHookDecoratorWithEnum:
@@ -578,6 +674,41 @@ class TestToolDecoratorExtended:
         assert "name" in metadata["parameters"]
         assert "age" in metadata["parameters"]
     
+    def test_tool_with_json_schema_required(self):
+        """Test that JSON Schema 'required' list drives parameter requiredness"""
+        @tool(
+            parameters={
+                "type": "object",
+                "properties": {
+                    "city": {"type": "string", "description": "City name"},
+                    "units": {"type": "string", "enum": ["c", "f"]},
+                },
+                "required": ["city"],
+            }
+        )
+        def fetch_weather(city: str, units: str = "f"):
+            pass
+        
+        params = fetch_weather._tool_metadata["parameters"]
+        assert params["city"]["required"] is True
+        assert params["units"]["required"] is False
+        assert params["units"]["enum"] == ["c", "f"]
+    
+    def test_tool_parameters_schema_precomputed(self):
+        """Test that the parameters JSON Schema is built at decoration time"""
+        @tool(description="Search")
+        def search(query: str, limit: int = 10):
+            pass
+        
+        assert search._tool_metadata["parameters_schema"] == {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": ""},
+                "limit": {"type": "number", "description": ""},
+            },
+            "required": ["query"],
+        }
+    
     def test_tool_auto_detect_types(self):
         """Test tool auto-detects parameter types"""
         @tool(description="Test function")
@@ -605,6 +736,22 @@ class TestToolDecoratorExtended:
         assert params["optional"]["required"] == False
         assert params["optional"]["default"] == "default"
     
+    def test_tool_default_with_custom_eq(self):
+        """Test defaults that compare equal to anything are still optional"""
+        class AlwaysEqual:
+            def __eq__(self, other):
+                return True
+        
+        sentinel = AlwaysEqual()
+        
+        @tool(description="Test with custom default")
+        def test_func(value: str = sentinel):
+            pass
+        
+        params = test_func._tool_metadata["parameters"]
+        assert params["value"]["required"] == False
+        assert params["value"]["default"] is sentinel
+    
     def test_tool_with_enum(self):
         """Test tool with enum parameter"""
         @tool(
@@ -335,3 +335,56 @@ class TestStdioTransport:
         
         assert parsed["id"] == "test"
         assert parsed["method"] == "invoke"
+    
+    def test_parse_message_with_markers(self):
+        """Test parsing a marked IPC line"""
+        transport = StdioTransport()
+        line = '__COGNIA_IPC__{"id": "m1", "type": "response", "payload": {"ok": true}}__END__'
+        
+        message = transport._parse_message(line)
+        
+        assert message.id == "m1"
+        assert message.type == "response"
+        assert message.payload == {"ok": True}
+    
+    @pytest.mark.asyncio
+    async def test_send_roundtrip(self, capsys):
+        """Test that sent messages parse back to the same content"""
+        transport = StdioTransport()
+        transport._connected = True
+        
+        await transport.send(IPCMessage(
+            id="m2",
+            type="invoke",
+            command="count_words",
+            args={"text": "héllo", 1: "non-string key"},
+        ))
+        line = capsys.readouterr().out.strip()
+        message = transport._parse_message(line)
+        
+        assert message.command == "count_words"
+        assert message.args == {"text": "héllo", "1": "non-string key"}
+    
+    @pytest.mark.asyncio
+    async def test_register_pending_uses_running_loop(self):
+        """Test that pending responses are futures on the running loop"""
+        transport = StdioTransport()
+        
+        future = transport.register_pending("m3")
+        
+        assert future.get_loop() is asyncio.get_running_loop()
+        assert transport._pending_responses["m3"] is future
+    
+    def test_json_helpers_without_orjson(self):
+        """Test that the stdlib json fallback is used when orjson is missing"""
+        from cognia import ipc
+        
+        with patch.object(ipc, "orjson", None):
+            assert json.loads(ipc._json_dumps({"a": [1, 2]})) == {"a": [1, 2]}
+            assert ipc._json_loads('{"a": 1}') == {"a": 1}
+    
+    def test_json_dumps_falls_back_for_big_ints(self):
+        """Test that values orjson rejects are still serialized"""
+        from cognia import ipc
+        
+        assert json.loads(ipc._json_dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
@@ -89,6 +89,43 @@ class TestPluginMeta:
         assert len(TestPlugin._registered_tools) == 2
         assert len(TestPlugin._registered_hooks) == 2
         assert len(TestPlugin._registered_commands) == 1
+    
+    def test_metaclass_inherits_and_overrides_tools(self):
+        """Test that subclasses inherit tools and undecorated overrides drop them"""
+        class BasePlugin(Plugin):
+            name = "base"
+            
+            @tool(description="Kept")
+            def kept(self) -> str:
+                return "kept"
+            
+            @tool(description="Replaced")
+            def replaced(self) -> str:
+                return "replaced"
+        
+        class ChildPlugin(BasePlugin):
+            def replaced(self) -> str:
+                return "plain"
+            
+            @hook("on_load")
+            async def on_loaded(self):
+                pass
+        
+        assert [t['name'] for t in BasePlugin._registered_tools] == ['kept', 'replaced']
+        assert [t['name'] for t in ChildPlugin._registered_tools] == ['kept']
+        assert len(ChildPlugin._registered_hooks) == 1
+    
+    def test_metaclass_collects_from_mixins(self):
+        """Test that tools defined on non-plugin mixins are collected"""
+        class ToolMixin:
+            @tool(description="Mixin tool")
+            def mixin_tool(self) -> str:
+                return "mixin"
+        
+        class MixedPlugin(ToolMixin, Plugin):
+            name = "mixed"
+        
+        assert [t['name'] for t in MixedPlugin._registered_tools] == ['mixin_tool']
 
 
 class TestPlugin:
@@ -230,6 +267,17 @@ class TestPlugin:
         assert PluginCapability.HOOKS in manifest.capabilities
         assert "requests>=2.28" in manifest.python_dependencies
     
+    def test_get_manifest_with_string_capabilities(self, plugin_context):
+        """Test that string capabilities are normalized for serialization"""
+        class TestPlugin(Plugin):
+            name = "test-plugin"
+            capabilities = ["tools", "hooks"]
+        
+        manifest = TestPlugin(plugin_context).get_manifest()
+        
+        assert manifest.capabilities == [PluginCapability.TOOLS, PluginCapability.HOOKS]
+        assert manifest.to_dict()["capabilities"] == ["tools", "hooks"]
+    
     def test_get_tools(self, plugin_context):
         """Test get_tools method"""
         class TestPlugin(Plugin):
@@ -292,6 +340,27 @@ class TestPlugin:
         
         assert len(commands) == 1
         assert commands[0]['name'] == 'cmd1'
+    
+    def test_slotted_subclass_has_no_dict(self, plugin_context):
+        """Test that a subclass declaring empty __slots__ has no instance dict"""
+        class SlottedPlugin(Plugin):
+            __slots__ = ()
+            name = "slotted"
+        
+        plugin = SlottedPlugin(plugin_context)
+        
+        assert not hasattr(plugin, '__dict__')
+        assert plugin.context is plugin_context
+    
+    def test_unslotted_subclass_allows_custom_attributes(self, plugin_context):
+        """Test that subclasses without __slots__ can still set attributes"""
+        class CustomPlugin(Plugin):
+            name = "custom"
+        
+        plugin = CustomPlugin(plugin_context)
+        plugin.cache = {}
+        
+        assert plugin.cache == {}
 
 
 class TestPluginGenerateManifest:
@@ -479,3 +548,47 @@ class TestPluginWithExtendedContext:
         mode = plugin.get_theme_mode()
         
         assert mode == ThemeMode.DARK
+
+
+class TestPackageExports:
+    """Tests for lazily resolved package-level exports"""
+    
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ is reachable from the package"""
+        import cognia
+        
+        for export_name in cognia.__all__:
+            assert getattr(cognia, export_name) is not None
+    
+    def test_lazy_name_matches_submodule(self):
+        """Test that lazy exports are the same objects as in their submodule"""
+        import cognia
+        from cognia import a2ui, schema
+        
+        assert cognia.Schema is schema.Schema
+        assert cognia.a2ui_component_helper is a2ui.component
+    
+    def test_type_checking_imports_match_lazy_exports(self):
+        """Test that the TYPE_CHECKING imports mirror the lazy export table"""
+        import ast
+        import cognia
+        
+        tree = ast.parse(open(cognia.__file__, encoding="utf-8").read())
+        block = next(
+            node for node in tree.body
+            if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+        )
+        imported = {
+            alias.asname or alias.name: (node.module, alias.name)
+            for node in block.body if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+        }
+        
+        assert imported == cognia._LAZY_IMPORTS
+    
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names raise AttributeError"""
+        import cognia
+        
+        with pytest.raises(AttributeError):
+            cognia.does_not_exist
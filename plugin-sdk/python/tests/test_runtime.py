@@ -16,7 +16,8 @@ from cognia.runtime import (
     RuntimePluginContext,
     create_runtime_context,
 )
-from cognia.ipc import TauriIPC, IPCConfig, IPCMode, MockTransport
+from cognia.ipc import TauriIPC, IPCConfig, IPCMode, IPCError, MockTransport
+from cognia.types import NetworkRequestOptions, SessionFilter
 
 
 class TestRuntimeSessionAPI:
@@ -93,6 +94,67 @@ class TestRuntimeSessionAPI:
         
         mock_ipc.invoke.assert_called_once()
 
+    
+    @staticmethod
+    def _paged(items):
+        """Build a list call that serves items by filter limit/offset"""
+        calls = []
+        
+        async def fetch(*args):
+            query = args[-1]
+            calls.append((query.limit, query.offset))
+            return items[query.offset:query.offset + query.limit]
+        
+        return fetch, calls
+    
+    @pytest.mark.asyncio
+    async def test_iter_sessions_pages(self, session_api):
+        """Test that iter_sessions fetches one page at a time"""
+        fetch, calls = self._paged(list(range(5)))
+        
+        with patch.object(session_api, "list_sessions", fetch):
+            result = [s async for s in session_api.iter_sessions(batch_size=2)]
+        
+        assert result == [0, 1, 2, 3, 4]
+        assert calls == [(2, 0), (2, 2), (2, 4)]
+    
+    @pytest.mark.asyncio
+    async def test_iter_sessions_honours_filter_limit(self, session_api):
+        """Test that the filter's limit and offset bound the whole iteration"""
+        fetch, calls = self._paged(list(range(10)))
+        
+        with patch.object(session_api, "list_sessions", fetch):
+            result = [s async for s in session_api.iter_sessions(SessionFilter(limit=3, offset=4), batch_size=2)]
+        
+        assert result == [4, 5, 6]
+        assert calls == [(2, 4), (1, 6)]
+    
+    @pytest.mark.asyncio
+    async def test_iter_messages_pages(self, session_api):
+        """Test that iter_messages passes the session id to every page"""
+        fetch, calls = self._paged(list(range(3)))
+        session_ids = []
+        
+        async def get_messages(session_id, options):
+            session_ids.append(session_id)
+            return await fetch(options)
+        
+        with patch.object(session_api, "get_messages", get_messages):
+            result = [m async for m in session_api.iter_messages("session-1", batch_size=2)]
+        
+        assert result == [0, 1, 2]
+        assert session_ids == ["session-1", "session-1"]
+    
+    @pytest.mark.asyncio
+    async def test_iter_sessions_stops_when_host_ignores_paging(self, session_api):
+        """Test that an unpaged host response is yielded once, not refetched"""
+        async def list_sessions(filter):
+            return ["a", "b", "c"]
+        
+        with patch.object(session_api, "list_sessions", list_sessions):
+            result = [s async for s in session_api.iter_sessions(batch_size=2)]
+        
+        assert result == ["a", "b", "c"]
 
 class TestRuntimeProjectAPI:
     """Tests for RuntimeProjectAPI"""
@@ -217,6 +279,39 @@ class TestRuntimeVectorAPI:
         )
         
         mock_ipc.invoke.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_stream_embed(self, vector_api, mock_ipc):
+        """Test streaming embeddings in bounded batches"""
+        mock_ipc.invoke.side_effect = lambda cmd, args: [[float(len(t))] for t in args["texts"]]
+        
+        batches = [b async for b in vector_api.stream_embed((f"t{i}" for i in range(5)), batch_size=2)]
+        
+        assert batches == [[[2.0], [2.0]], [[2.0], [2.0]], [[2.0]]]
+        sent = [call.args[1]["texts"] for call in mock_ipc.invoke.call_args_list]
+        assert sent == [["t0", "t1"], ["t2", "t3"], ["t4"]]
+    
+    @pytest.mark.asyncio
+    async def test_search_batch(self, vector_api, mock_ipc):
+        """Test searching with several embeddings, results in query order"""
+        async def invoke(cmd, args):
+            return [{"id": str(args["embedding"][0]), "content": "c", "score": 1.0}]
+        mock_ipc.invoke.side_effect = invoke
+        
+        class Rows:
+            def tolist(self):
+                return [[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]]
+        
+        results = await vector_api.search_batch("collection", Rows())
+        
+        assert [r[0].id for r in results] == ["1.0", "2.0", "3.0"]
+        assert mock_ipc.invoke.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_stream_embed_rejects_empty_batches(self, vector_api):
+        """Test that a non-positive batch size is rejected"""
+        with pytest.raises(ValueError):
+            [b async for b in vector_api.stream_embed(["a"], batch_size=0)]
 
 
 class TestRuntimeStorageAPI:
@@ -271,6 +366,23 @@ class TestRuntimeStorageAPI:
         
         assert len(result) == 3
 
+    
+    @pytest.mark.asyncio
+    async def test_set_many_and_get_many(self, storage_api, mock_ipc):
+        """Test that set_many and get_many round-trip values by key"""
+        stored = {}
+        
+        async def invoke(command, args):
+            if command == "storage_set":
+                stored[args["key"]] = args["value"]
+            return stored.get(args.get("key"))
+        
+        mock_ipc.invoke.side_effect = invoke
+        await storage_api.set_many({"a": 1, "b": [2]})
+        result = await storage_api.get_many(["b", "a", "missing"])
+        
+        assert stored == {"a": 1, "b": [2]}
+        assert result == {"b": [2], "a": 1, "missing": None}
 
 class TestRuntimeEventsAPI:
     """Tests for RuntimeEventsAPI"""
@@ -314,6 +426,54 @@ class TestRuntimeEventsAPI:
         await events_api.off("my_event", handler)
         # Should not raise
 
+    
+    @pytest.fixture
+    def local_events_api(self):
+        """Create events API whose IPC calls are plain mocks"""
+        ipc = Mock(spec=TauriIPC)
+        ipc.emit = AsyncMock()
+        ipc.listen = Mock(side_effect=lambda event, handler: Mock())
+        return RuntimeEventsAPI(ipc)
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_only_its_registration(self, local_events_api):
+        """Test that each on() cleanup removes its own registration"""
+        calls = []
+        handler = calls.append
+        first = local_events_api.on("evt", handler)
+        local_events_api.on("evt", handler)
+        
+        first()
+        first()
+        local_events_api.emit("evt", 1)
+        
+        assert calls == [1]
+    
+    @pytest.mark.asyncio
+    async def test_off_unsubscribes_ipc(self, local_events_api):
+        """Test that off() also drops the IPC subscription"""
+        handler = Mock()
+        local_events_api.on("evt", handler)
+        ipc_unsubscribe = local_events_api._handlers["evt"][0][1]
+        
+        local_events_api.off("evt", handler)
+        local_events_api.emit("evt", 1)
+        
+        handler.assert_not_called()
+        ipc_unsubscribe.assert_called_once()
+        assert "evt" not in local_events_api._handlers
+    
+    @pytest.mark.asyncio
+    async def test_emit_tolerates_handlers_unsubscribing(self, local_events_api):
+        """Test that handlers may unsubscribe during dispatch"""
+        calls = []
+        local_events_api.once("evt", lambda value: calls.append(("once", value)))
+        local_events_api.on("evt", lambda value: calls.append(("on", value)))
+        
+        local_events_api.emit("evt", 1)
+        local_events_api.emit("evt", 2)
+        
+        assert calls == [("once", 1), ("on", 1), ("on", 2)]
 
 class TestRuntimeNetworkAPI:
     """Tests for RuntimeNetworkAPI"""
@@ -344,6 +504,21 @@ class TestRuntimeNetworkAPI:
         mock_ipc.invoke.assert_called_once()
         assert result["status"] == 200
     
+    @pytest.mark.asyncio
+    async def test_get_with_options(self, network_api, mock_ipc):
+        """Test HTTP GET keeps caller options but forces the method"""
+        mock_ipc.invoke.return_value = {
+            "ok": True, "status": 200, "status_text": "OK", "headers": {}, "data": None
+        }
+        options = NetworkRequestOptions(method="POST", headers={"X-Test": "1"})
+        
+        await network_api.get("https://api.example.com/data", options)
+        
+        sent = mock_ipc.invoke.call_args[0][1]["options"]
+        assert sent["method"] == "GET"
+        assert sent["headers"] == {"X-Test": "1"}
+        assert options.method == "POST"
+    
     @pytest.mark.asyncio
     async def test_post(self, network_api, mock_ipc):
         """Test HTTP POST"""
@@ -389,6 +564,150 @@ class TestRuntimeFileSystemAPI:
         """Create filesystem API with mock IPC"""
         return RuntimeFileSystemAPI(mock_ipc)
     
+    @pytest.fixture
+    def plugin_fs_api(self, mock_ipc):
+        """Create filesystem API bound to a plugin id"""
+        return RuntimeFileSystemAPI(mock_ipc, "test-plugin")
+    
+    @pytest.mark.asyncio
+    async def test_read_many(self, plugin_fs_api):
+        """Test that read_many returns contents in path order"""
+        async def read_text(path):
+            return f"text:{path}"
+        
+        async def read_binary(path):
+            return path.encode()
+        
+        with patch.object(plugin_fs_api, "read_text", read_text), patch.object(plugin_fs_api, "read_binary", read_binary):
+            assert await plugin_fs_api.read_many(["a", "b"]) == ["text:a", "text:b"]
+            assert await plugin_fs_api.read_many(["a", "b"], binary=True) == [b"a", b"b"]
+    
+    @pytest.mark.asyncio
+    async def test_write_many_dispatches_by_content_type(self, plugin_fs_api):
+        """Test that write_many writes str as text and bytes as binary"""
+        with patch.object(plugin_fs_api, "write_text", AsyncMock()) as write_text, \
+                patch.object(plugin_fs_api, "write_binary", AsyncMock()) as write_binary:
+            await plugin_fs_api.write_many({"a.txt": "hello", "b.bin": b"\x00"})
+        
+        write_text.assert_awaited_once_with("a.txt", "hello")
+        write_binary.assert_awaited_once_with("b.bin", b"\x00")
+    
+    @pytest.mark.asyncio
+    async def test_stat_many(self, plugin_fs_api):
+        """Test that stat_many returns one result per path"""
+        with patch.object(plugin_fs_api, "stat", AsyncMock(side_effect=lambda path: {"path": path})):
+            result = await plugin_fs_api.stat_many(["a", "b"])
+        
+        assert result == [{"path": "a"}, {"path": "b"}]
+    
+    @pytest.mark.asyncio
+    async def test_append_text_writes_through(self, plugin_fs_api, mock_ipc):
+        """Test that an unbuffered append is sent before returning"""
+        await plugin_fs_api.append_text("log.txt", "a")
+        
+        mock_ipc.invoke.assert_awaited_once_with("fs_append_text", {"path": "log.txt", "content": "a"})
+    
+    @pytest.mark.asyncio
+    async def test_append_text_raises_host_errors(self, plugin_fs_api, mock_ipc):
+        """Test that a failed append is reported to the caller"""
+        mock_ipc.invoke.side_effect = IPCError("disk full")
+        
+        with pytest.raises(IPCError):
+            await plugin_fs_api.append_text("log.txt", "a")
+    
+    @pytest.mark.asyncio
+    async def test_buffered_appends_coalesce_until_exit(self, plugin_fs_api, mock_ipc):
+        """Test that appends in a buffered block are sent as one call on exit"""
+        async with plugin_fs_api.buffered_appends():
+            for i in range(3):
+                await plugin_fs_api.append_text("log.txt", f"line {i}\n")
+            mock_ipc.invoke.assert_not_called()
+        
+        mock_ipc.invoke.assert_awaited_once_with(
+            "fs_append_text", {"path": "log.txt", "content": "line 0\nline 1\nline 2\n"}
+        )
+    
+    @pytest.mark.asyncio
+    async def test_buffered_appends_flush_when_large(self, plugin_fs_api, mock_ipc):
+        """Test that reaching the size threshold sends immediately"""
+        from cognia import runtime
+        
+        with patch.object(runtime, "_APPEND_FLUSH_SIZE", 4):
+            async with plugin_fs_api.buffered_appends():
+                await plugin_fs_api.append_text("log.txt", "ab")
+                mock_ipc.invoke.assert_not_called()
+                await plugin_fs_api.append_text("log.txt", "cd")
+                mock_ipc.invoke.assert_awaited_once_with(
+                    "fs_append_text", {"path": "log.txt", "content": "abcd"}
+                )
+    
+    @pytest.mark.asyncio
+    async def test_buffered_appends_are_scoped_to_the_task(self, plugin_fs_api, mock_ipc):
+        """Test that another task's appends still write through during a buffered block"""
+        import asyncio
+        
+        entered = asyncio.Event()
+        release = asyncio.Event()
+        
+        async def buffered_writer():
+            async with plugin_fs_api.buffered_appends():
+                await plugin_fs_api.append_text("buffered.txt", "a")
+                entered.set()
+                await release.wait()
+        
+        task = asyncio.create_task(buffered_writer())
+        await entered.wait()
+        
+        await plugin_fs_api.append_text("direct.txt", "b")
+        sent = [c.args[1] for c in mock_ipc.invoke.await_args_list]
+        assert {"path": "direct.txt", "content": "b"} in sent
+        
+        release.set()
+        await task
+        sent = [c.args[1] for c in mock_ipc.invoke.await_args_list]
+        assert sent.count({"path": "buffered.txt", "content": "a"}) == 1
+    
+    @pytest.mark.asyncio
+    async def test_reads_wait_for_an_in_flight_flush(self, plugin_fs_api, mock_ipc):
+        """Test that a read issued during a flush reaches the host after the append"""
+        import asyncio
+        
+        order = []
+        append_started = asyncio.Event()
+        release_append = asyncio.Event()
+        
+        async def invoke(command, args):
+            if command == "fs_append_text":
+                append_started.set()
+                await release_append.wait()
+            order.append(command)
+            return "x"
+        
+        mock_ipc.invoke.side_effect = invoke
+        
+        async def buffered_writer():
+            async with plugin_fs_api.buffered_appends():
+                await plugin_fs_api.append_text("log.txt", "x")
+        
+        writer = asyncio.create_task(buffered_writer())
+        await append_started.wait()
+        reader = asyncio.create_task(plugin_fs_api.read_many(["log.txt"]))
+        await asyncio.sleep(0)
+        release_append.set()
+        await asyncio.gather(writer, reader)
+        
+        assert order == ["fs_append_text", "fs_read_text"]
+    
+    @pytest.mark.asyncio
+    async def test_other_calls_flush_pending_appends(self, plugin_fs_api, mock_ipc):
+        """Test that a read sees earlier buffered appends"""
+        mock_ipc.invoke.return_value = "x"
+        async with plugin_fs_api.buffered_appends():
+            await plugin_fs_api.append_text("log.txt", "x")
+            await plugin_fs_api.read_text("log.txt")
+        
+        assert [c.args[0] for c in mock_ipc.invoke.await_args_list] == ["fs_append_text", "fs_read_text"]
+    
     @pytest.mark.asyncio
     async def test_read_file(self, fs_api, mock_ipc):
         """Test read file"""
@@ -365,6 +365,25 @@ class TestPluginContext:
         captured = capsys.readouterr()
         assert "[ERROR][test]" in captured.out
         assert "Error message" in captured.out
+    
+    def test_log_with_args(self, capsys):
+        """Test that log args are %-formatted into the message"""
+        context = PluginContext(plugin_id="test", plugin_path="/test")
+        context.log_info("Agent %s executed step: %s", "agent-1", "search")
+        context.log_info("100% literal")
+        captured = capsys.readouterr()
+        assert "Agent agent-1 executed step: search" in captured.out
+        assert "100% literal" in captured.out
+    
+    def test_log_level_drops_lower_levels_before_formatting(self, capsys):
+        """Test that messages below log_level are neither formatted nor printed"""
+        import logging
+        context = PluginContext(plugin_id="test", plugin_path="/test", log_level=logging.WARNING)
+        context.log_debug("%s %s", "needs two args")
+        context.log_info("Info message")
+        context.log_warn("Warning message")
+        captured = capsys.readouterr()
+        assert captured.out == "[WARN][test] Warning message\n"
 
 
 class TestToolContext:
@@ -932,3 +951,28 @@ class TestWindowOptions:
         assert opts.title == "My Window"
         assert opts.width == 1024
         assert opts.center is True
+
+
+class TestDataclassSlots:
+    """Tests for slotted DTO dataclasses"""
+    
+    def test_dtos_have_no_instance_dict(self):
+        """Test that every types dataclass is declared with slots"""
+        import dataclasses
+        from cognia import types
+        
+        dtos = [
+            obj for obj in vars(types).values()
+            if isinstance(obj, type) and dataclasses.is_dataclass(obj) and obj.__module__ == types.__name__
+        ]
+        assert dtos
+        for dto in dtos:
+            assert "__slots__" in dto.__dict__, dto.__name__
+    
+    def test_dtos_stay_mutable(self):
+        """Test that slotted DTOs still accept field assignment"""
+        opts = NetworkRequestOptions()
+        opts.method = "POST"
+        assert opts.method == "POST"
+        with pytest.raises(AttributeError):
+            opts.not_a_field = 1